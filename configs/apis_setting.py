@@ -16,7 +16,12 @@ if env_path.exists():
 # API 설정
 HOLIDAY_API_CONFIG = {
     'api_key': os.getenv('HOLIDAY_API_KEY'),
-    'base_url': 'http://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService/getRestDeInfo'
+    'base_url': 'http://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService/getRestDeInfo',
+    # 월별 공휴일 응답 디스크 캐시 경로 (프로세스 재시작 후에도 재사용)
+    'cache_dir': os.getenv(
+        'HOLIDAY_CACHE_DIR',
+        str(Path.home() / '.cache' / 'exchange_collector' / 'holidays'),
+    ),
 }
 
 EXCHANGE_RATE_API_CONFIG = {
@@ -31,8 +31,9 @@ class TelegramSettings:
         self.chat_id = self._get_env_value('TELEGRAM_CHAT_ID')
 
         # 그래프 전송 설정 로드 (기본값: false)
+        # 길이가 4가 아니면 'true'가 될 수 없으므로 lower() 변환 전에 걸러낸다
         send_graph_value = self._get_env_value('TELEGRAM_SEND_GRAPH')
-        self._send_graph = send_graph_value.lower() == 'true'
+        self._send_graph = len(send_graph_value) == 4 and send_graph_value.lower() == 'true'
 
         # 필수 설정 검증
         self._validate_settings()
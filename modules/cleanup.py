@@ -1,5 +1,7 @@
+import os
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,16 +22,16 @@ class FileCleaner:
             logger.warning(f"대상 디렉토리가 존재하지 않거나 디렉토리가 아닙니다: {self.target_dir}")
             return
 
-        now = datetime.now()
-        cutoff_time = now - timedelta(days=self.days)
+        # 파일마다 datetime을 만들지 않도록 기준 시각을 epoch 초로 한 번만 계산해 mtime과 비교
+        cutoff_ts = time.time() - timedelta(days=self.days).total_seconds()
 
         try:
-            for file in self.target_dir.iterdir():
-                if file.is_file():
-                    file_mtime = datetime.fromtimestamp(file.stat().st_mtime)
-                    if file_mtime < cutoff_time:
-                        file.unlink()
-                        logger.info(f"삭제된 파일: {file}")
+            # scandir 항목은 파일 종류를 디렉토리 조회 결과로 알 수 있어 파일당 stat이 한 번으로 줄어든다
+            with os.scandir(self.target_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                        os.unlink(entry.path)
+                        logger.info(f"삭제된 파일: {entry.path}")
         except Exception as e:
             logger.error(f"파일 삭제 중 오류 발생: {str(e)}")
             raise
\ No newline at end of file
@@ -1,18 +1,43 @@
 # modules/mysql_connector.py
-import mysql.connector
-from mysql.connector import Error
+import threading
+
+from mysql.connector import Error, pooling
 from configs.mysql_setting import MYSQL_CONFIG
 
+# 스케줄러 틱마다 TCP/인증 핸드셰이크를 반복하지 않도록 프로세스 단위로 풀을 공유한다
+_pool = None
+_pool_lock = threading.Lock()
+
+# 노티파이어가 수집기를 병렬로 실행할 때 동시에 대여하는 연결 수
+COLLECTOR_WORKERS = 3
+# 수집 중에도 노티파이어 본체와 텔레그램 봇 핸들러가 연결을 빌릴 수 있도록 남겨 두는 여유분
+# (풀이 비면 get_connection은 기다리지 않고 바로 PoolError를 낸다)
+POOL_HEADROOM = 3
+POOL_SIZE = COLLECTOR_WORKERS + POOL_HEADROOM
+
+
+def get_pool(size=POOL_SIZE):
+    """프로세스 공용 MySQL 연결 풀 반환 (최초 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name="exchange_collector",
+                    pool_size=size,
+                    **MYSQL_CONFIG,
+                )
+    return _pool
+
 
 class MySQLConnector:
     def __init__(self):
         self.connection = None
 
     def connect(self):
-        """데이터베이스 연결"""
+        """데이터베이스 연결 (풀에서 연결을 대여)"""
         try:
-            self.connection = mysql.connector.connect(**MYSQL_CONFIG)
-            print("MySQL 데이터베이스 연결 성공")
+            self.connection = get_pool().get_connection()
         except Error as e:
             print(f"MySQL 연결 오류: {e}")
             raise
@@ -20,11 +45,20 @@ class MySQLConnector:
     def get_connection(self):
         """현재 연결 반환"""
         if self.connection is None or not self.connection.is_connected():
+            # 끊어진 연결을 먼저 반납한다 (반납 중 세션 초기화 오류는 close()가 처리)
+            self.close()
             self.connect()
         return self.connection
 
     def close(self):
-        """데이터베이스 연결 종료"""
-        if self.connection and self.connection.is_connected():
+        """연결을 풀에 반납 (물리 연결은 유지되어 다음 틱에서 재사용)"""
+        if self.connection is None:
+            return
+        try:
+            # 연결이 끊긴 상태면 반납 시 세션 초기화(reset_session)가 실패한다.
+            # 이 경우에도 풀에는 반납되므로 오류는 기록만 하고, 호출 측의 원래 예외를 가리지 않는다.
             self.connection.close()
-            print("MySQL 연결이 종료되었습니다.")
\ No newline at end of file
+        except Error as e:
+            print(f"MySQL 연결 반납 중 오류: {e}")
+        finally:
+            self.connection = None
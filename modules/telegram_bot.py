@@ -16,13 +16,17 @@ from configs.telegram_setting import get_credentials
 from modules.mysql_connector import MySQLConnector
 from utils.sparkline_generator import SparklineGenerator
 from utils.html_message_formatter import HTMLMessageFormatter
-from utils.exchange_rate_visualizer import ExchangeRateVisualizer
-from utils.gold_price_visualizer import GoldPriceVisualizer
 from utils.gold_message_formatter import GoldMessageFormatter
 from utils.gold_price_collector import GoldPriceCollector
-from utils.exchange_rate_notifier import get_latest_gold, get_weekly_gold
+from utils.exchange_rate_notifier import (
+    NOTIFY_CURRENCIES,
+    get_exchange_rates_by_dates,
+    get_latest_gold,
+    get_latest_rate_date,
+    get_weekly_gold,
+    get_weekly_rates_by_currency,
+)
 from utils.toss_exchange_client import TossExchangeClient
-from utils.time_utils import kst_today
 
 logger = logging.getLogger(__name__)
 
@@ -41,35 +45,6 @@ def _fmt_time(iso_str: str) -> str:
         return iso_str
 
 
-def _get_exchange_rates(db_connector, date):
-    """특정 날짜의 환율 정보 조회"""
-    query = """
-    SELECT cur_unit, deal_bas_r, bkpr
-    FROM exchange_rates
-    WHERE DATE(search_date) = %s
-    AND cur_unit IN ('USD', 'JPY(100)')
-    """
-    connection = db_connector.get_connection()
-    with connection.cursor() as cursor:
-        cursor.execute(query, (date,))
-        return {row[0]: {"deal_bas_r": row[1], "bkpr": row[2]} for row in cursor.fetchall()}
-
-
-def _get_weekly_rates(db_connector, currency, days=7):
-    """최근 N일간의 환율 데이터 조회 (스파크라인용)"""
-    query = """
-    SELECT deal_bas_r
-    FROM exchange_rates
-    WHERE cur_unit = %s AND search_date >= %s
-    ORDER BY search_date ASC
-    """
-    start_date = kst_today() - timedelta(days=days)
-    connection = db_connector.get_connection()
-    with connection.cursor() as cursor:
-        cursor.execute(query, (currency, start_date))
-        return [float(row[0]) for row in cursor.fetchall()]
-
-
 async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """/start 명령어 핸들러"""
     welcome_message = (
@@ -100,29 +75,28 @@ async def rate_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         db_connector = MySQLConnector()
 
         # 최신 데이터 날짜 조회
-        conn = db_connector.get_connection()
-        with conn.cursor() as cursor:
-            cursor.execute("SELECT MAX(search_date) FROM exchange_rates")
-            latest_date = cursor.fetchone()[0]
+        latest_date = get_latest_rate_date(db_connector)
 
         if not latest_date:
             await update.message.reply_text("📭 환율 데이터가 없습니다.")
             return
 
-        # 환율 조회
-        today_rates = _get_exchange_rates(db_connector, latest_date)
+        # 환율 조회 (최신일/전일을 한 번의 쿼리로)
         yesterday = latest_date - timedelta(days=1)
-        yesterday_rates = _get_exchange_rates(db_connector, yesterday)
+        rates_by_date = get_exchange_rates_by_dates(db_connector, [latest_date, yesterday])
+        today_rates = rates_by_date[latest_date]
+        yesterday_rates = rates_by_date[yesterday]
 
         if not today_rates:
             await update.message.reply_text("📭 환율 데이터가 없습니다.")
             return
 
         # 스파크라인 생성
-        sparklines = {}
-        for currency in ['USD', 'JPY(100)']:
-            week_data = _get_weekly_rates(db_connector, currency)
-            sparklines[currency] = SparklineGenerator.generate(week_data)
+        weekly_rates = get_weekly_rates_by_currency(db_connector, NOTIFY_CURRENCIES)
+        sparklines = {
+            currency: SparklineGenerator.generate(week_data)
+            for currency, week_data in weekly_rates.items()
+        }
 
         # HTML 메시지 생성
         rates = {c: d['deal_bas_r'] for c, d in today_rates.items()}
@@ -138,7 +112,9 @@ async def rate_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         await update.message.reply_text(message, parse_mode="HTML")
 
-        # 그래프 생성 및 전송
+        # 그래프 생성 및 전송 (matplotlib/pandas는 그래프가 필요할 때만 로드)
+        from utils.exchange_rate_visualizer import ExchangeRateVisualizer
+
         visualizer = ExchangeRateVisualizer(db_connector)
         graph_path = visualizer.create_visualization(months=3)
         if graph_path:
@@ -198,6 +174,8 @@ async def gold_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         await update.message.reply_text(message, parse_mode="HTML")
 
+        from utils.gold_price_visualizer import GoldPriceVisualizer
+
         graph_path = GoldPriceVisualizer(db_connector).create_visualization(months=3)
         if graph_path:
             with open(graph_path, 'rb') as photo:
@@ -1,6 +1,7 @@
 # modules/telegram_sender.py
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Optional, Union
 
@@ -16,6 +17,8 @@ class TelegramSender:
 
     TELEGRAM_API_BASE = "https://api.telegram.org/bot{token}"
     TIMEOUT = 60  # API 호출 타임아웃 (초)
+    MAX_RATE_LIMIT_RETRIES = 3  # 429(요청 제한) 응답 시 재시도 횟수
+    MAX_RETRY_AFTER = 30  # 재시도 대기 상한 (초) - 스케줄러가 오래 멈추지 않도록 제한
 
     def __init__(self, chat_id: Optional[str] = None):
         """
@@ -105,6 +108,40 @@ class TelegramSender:
             logger.error(f"메시지 전송 중 예외 발생: {str(e)}", exc_info=True)
             return False
 
+    def _retry_after(self, response) -> float:
+        """
+        429 응답의 대기 시간(초) 추출
+        텔레그램은 본문 parameters.retry_after로 알려주며, 없으면 Retry-After 헤더를 사용한다.
+        """
+        try:
+            wait = float(response.json()["parameters"]["retry_after"])
+        except (ValueError, KeyError, TypeError):
+            try:
+                wait = float(response.headers.get("Retry-After", 1))
+            except (ValueError, TypeError):
+                wait = 1.0
+        return min(max(wait, 0.0), self.MAX_RETRY_AFTER)
+
+    def _post(self, url: str, rewind=None, **kwargs):
+        """
+        텔레그램 API POST 호출 (429 응답이면 retry_after만큼 기다린 뒤 재시도)
+        :param rewind: 재시도 전에 호출할 함수 (업로드 파일 위치 되돌리기 등)
+        :return: 마지막 응답
+        """
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            response = requests.post(url, timeout=self.TIMEOUT, **kwargs)
+            if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                return response
+
+            wait = self._retry_after(response)
+            logger.warning(
+                f"텔레그램 API 요청 제한(429): {wait:.0f}초 후 재시도 "
+                f"({attempt + 1}/{self.MAX_RATE_LIMIT_RETRIES})"
+            )
+            time.sleep(wait)
+            if rewind:
+                rewind()
+
     def _send_text(self, chat_id: str, text: str,
                    parse_mode: Optional[str] = None) -> bool:
         """
@@ -125,7 +162,7 @@ class TelegramSender:
             payload["parse_mode"] = parse_mode
 
         try:
-            response = requests.post(url, json=payload, timeout=self.TIMEOUT)
+            response = self._post(url, json=payload)
             response.raise_for_status()
 
             result = response.json()
@@ -158,8 +195,8 @@ class TelegramSender:
         try:
             with open(file_path, "rb") as photo_file:
                 files = {"photo": (file_path.name, photo_file)}
-                response = requests.post(
-                    url, data=data, files=files, timeout=self.TIMEOUT
+                response = self._post(
+                    url, rewind=lambda: photo_file.seek(0), data=data, files=files
                 )
                 response.raise_for_status()
 
@@ -21,12 +21,12 @@ def get_exchange_rates(db_connector, date):
     query = """
     SELECT cur_unit, deal_bas_r, bkpr
     FROM exchange_rates 
-    WHERE DATE(search_date) = %s
+    WHERE search_date >= %s AND search_date < %s
     AND cur_unit IN ('USD', 'JPY(100)')
     """
     connection = db_connector.get_connection()
     with connection.cursor() as cursor:
-        cursor.execute(query, (date,))
+        cursor.execute(query, (date, date + timedelta(days=1)))
         return {row[0]: {"deal_bas_r": row[1], "bkpr": row[2]} for row in cursor.fetchall()}
 
 
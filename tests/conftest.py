@@ -0,0 +1,15 @@
+"""
+공용 pytest 설정
+
+Hypothesis 프로파일을 등록한다. 기본(dev)은 로컬 실행용으로 예제 수를 줄이고,
+HYPOTHESIS_PROFILE=ci 로 실행하면 더 많은 예제로 속성을 검증한다.
+개별 테스트에서 @settings를 지정하지 않으면 선택된 프로파일 값을 따른다.
+"""
+
+import os
+
+from hypothesis import settings
+
+settings.register_profile("dev", max_examples=25, deadline=None)
+settings.register_profile("ci", max_examples=200)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
@@ -52,7 +52,7 @@ def _make_mock_db_per_currency(rates_map: dict[str, list[float]]):
         cursor.fetchall.side_effect = fetchall_side_effect
         return cursor
 
-    mock_conn.cursor.side_effect = lambda: make_cursor()
+    mock_conn.cursor.side_effect = lambda **kwargs: make_cursor()
     return mock_db
 
 
@@ -325,3 +325,22 @@ class TestMissingCurrencyInTodayRates:
         signals = analyzer.analyze(today_rates)
 
         assert signals == []
+
+
+class TestCursorReuse:
+    """통화별 조회 시 prepared 커서 재사용 테스트"""
+
+    def test_single_prepared_cursor_shared_across_currencies(self):
+        """여러 통화를 분석해도 연결/커서는 한 번만 생성되고 close()로 정리된다"""
+        mock_db = _make_mock_db([1400.0] * 30)
+        analyzer = BuySignalAnalyzer(mock_db)
+
+        analyzer.analyze({"USD": 1400.0, "JPY(100)": 950.0})
+
+        mock_db.get_connection.assert_called_once()
+        mock_conn = mock_db.get_connection.return_value
+        mock_conn.cursor.assert_called_once_with(prepared=True)
+        assert mock_conn.cursor.return_value.execute.call_count == 2
+
+        analyzer.close()
+        mock_conn.cursor.return_value.close.assert_called_once()
@@ -30,13 +30,12 @@ def mock_dependencies():
     각 Mock 객체를 딕셔너리로 반환하여 테스트에서 접근 가능하게 한다.
     """
     with (
-        patch(f"{NOTIFIER_MODULE}.get_credentials") as mock_get_creds,
         patch(f"{NOTIFIER_MODULE}.TelegramSender") as mock_telegram_cls,
         patch(f"{NOTIFIER_MODULE}.MySQLConnector") as mock_db_cls,
         patch(f"{NOTIFIER_MODULE}.ExchangeRateCollector") as mock_collector_cls,
         patch(f"{NOTIFIER_MODULE}.TossUSDCollector") as mock_toss_collector_cls,
-        patch(f"{NOTIFIER_MODULE}.get_exchange_rates") as mock_get_rates,
-        patch(f"{NOTIFIER_MODULE}.get_weekly_rates") as mock_get_weekly,
+        patch(f"{NOTIFIER_MODULE}.get_exchange_rates_by_dates") as mock_get_rates,
+        patch(f"{NOTIFIER_MODULE}.get_weekly_rates_by_currency") as mock_get_weekly,
         patch(f"{NOTIFIER_MODULE}.SparklineGenerator") as mock_sparkline_cls,
         patch(f"{NOTIFIER_MODULE}.HTMLMessageFormatter") as mock_formatter_cls,
         patch(f"{NOTIFIER_MODULE}.is_send_graph_enabled") as mock_graph_enabled,
@@ -45,8 +44,7 @@ def mock_dependencies():
         # 금시세 알림은 별도 관심사 → 이 테스트에서는 no-op으로 격리
         patch(f"{NOTIFIER_MODULE}._send_gold") as mock_send_gold,
     ):
-        # 텔레그램 설정
-        mock_get_creds.return_value = {"chat_id": "test_chat_id"}
+        # 텔레그램 Sender
         mock_telegram = MagicMock()
         mock_telegram.send_message.return_value = True
         mock_telegram_cls.return_value = mock_telegram
@@ -60,14 +58,17 @@ def mock_dependencies():
         mock_collector_cls.return_value = mock_collector
         mock_toss_collector_cls.return_value = MagicMock()
 
-        # 환율 데이터 조회 (오늘/어제)
-        mock_get_rates.return_value = {
+        # 환율 데이터 조회 (오늘/어제 모두 같은 값)
+        rates = {
             "USD": {"deal_bas_r": 1400.0, "bkpr": 1390.0},
             "JPY(100)": {"deal_bas_r": 950.0, "bkpr": 945.0},
         }
+        mock_get_rates.side_effect = lambda db, dates: {d: dict(rates) for d in dates}
 
         # 주간 환율 데이터 (스파크라인용)
-        mock_get_weekly.return_value = [1400.0, 1405.0, 1410.0]
+        mock_get_weekly.side_effect = lambda db, currencies: {
+            c: [1400.0, 1405.0, 1410.0] for c in currencies
+        }
 
         # 스파크라인 생성
         mock_sparkline_cls.generate.return_value = "▁▂▃"
@@ -0,0 +1,159 @@
+"""
+ExchangeRateCollector 단위 테스트
+
+Mock DB로 수출입은행 응답 문자열(콤마 포함) 정규화와 일괄 저장(executemany)을 검증한다.
+"""
+
+from datetime import date
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from mysql.connector import Error
+
+from utils.exchange_rate_collector import ExchangeRateCollector
+
+
+def _make_mock_db():
+    mock_db = MagicMock()
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_db.get_connection.return_value = mock_conn
+    mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+    return mock_db, mock_conn, mock_cursor
+
+
+_ROWS = [
+    {'cur_unit': 'JPY(100)', 'ttb': '936.61', 'tts': '955.54', 'deal_bas_r': '946.08',
+     'bkpr': '946', 'cur_nm': '일본 옌'},
+    {'cur_unit': 'EUR', 'ttb': '1,610.13', 'tts': '1,642.66', 'deal_bas_r': '1,626.4',
+     'bkpr': '1,626', 'cur_nm': '유로'},
+]
+
+
+def test_save_data_batches_all_rows_in_one_call():
+    """모든 통화를 executemany 한 번으로 저장하고 한 번만 커밋한다"""
+    mock_db, mock_conn, mock_cursor = _make_mock_db()
+    collector = ExchangeRateCollector(mock_db, search_date='20260706')
+
+    collector.save_data(_ROWS)
+
+    mock_cursor.execute.assert_not_called()
+    mock_cursor.executemany.assert_called_once()
+    _query, params = mock_cursor.executemany.call_args[0]
+    assert [p['cur_unit'] for p in params] == ['JPY(100)', 'EUR']
+    assert params[1]['deal_bas_r'] == 1626.4
+    assert params[1]['ttb'] == 1610.13
+    assert all(p['search_date'] == date(2026, 7, 6) for p in params)
+    mock_conn.commit.assert_called_once()
+
+
+def test_save_data_runs_in_one_transaction():
+    """autocommit 상태와 무관하게 트랜잭션을 직접 시작해 한 번만 커밋한다"""
+    mock_db, mock_conn, _mock_cursor = _make_mock_db()
+    mock_conn.in_transaction = False
+    collector = ExchangeRateCollector(mock_db, search_date='20260706')
+
+    collector.save_data(_ROWS)
+
+    mock_conn.start_transaction.assert_called_once()
+    mock_conn.commit.assert_called_once()
+    mock_conn.rollback.assert_not_called()
+
+
+def test_save_data_rolls_back_on_error():
+    """저장 실패 시 롤백하고 예외를 그대로 전파한다"""
+    mock_db, mock_conn, mock_cursor = _make_mock_db()
+    mock_cursor.executemany.side_effect = Error("insert failed")
+    collector = ExchangeRateCollector(mock_db, search_date='20260706')
+
+    with pytest.raises(Error):
+        collector.save_data(_ROWS)
+
+    mock_conn.commit.assert_not_called()
+    mock_conn.rollback.assert_called_once()
+
+
+def test_save_data_keeps_original_error_when_rollback_fails():
+    """롤백이 실패해도 원래 저장 오류가 전파된다"""
+    mock_db, mock_conn, mock_cursor = _make_mock_db()
+    mock_cursor.executemany.side_effect = Error("insert failed")
+    mock_conn.rollback.side_effect = Error("connection lost")
+    collector = ExchangeRateCollector(mock_db, search_date='20260706')
+
+    with pytest.raises(Error, match="insert failed"):
+        collector.save_data(_ROWS)
+
+    mock_conn.rollback.assert_called_once()
+
+
+def test_collect_data_filters_target_currencies_from_raw_body():
+    """응답 바이트 본문을 디코딩해 대상 통화만 남긴다"""
+    collector = ExchangeRateCollector(MagicMock(), search_date='20260706')
+    collector.api_key = 'test-key'
+    body = [{'cur_unit': 'USD', 'deal_bas_r': '1,400'}] + _ROWS
+    collector.session = MagicMock()
+    collector.session.get.return_value.content = json.dumps(body, ensure_ascii=False).encode('utf-8')
+
+    result = collector.collect_data()
+
+    assert [item['cur_unit'] for item in result] == ['JPY(100)', 'EUR']
+    assert result[0]['cur_nm'] == '일본 옌'
+
+
+def test_collect_many_skips_failed_dates():
+    """여러 날짜를 동시에 조회하고, 실패한 날짜는 결과에서 제외한다"""
+    collector = ExchangeRateCollector(MagicMock())
+
+    def fake_collect(search_date=None):
+        if search_date == '20260707':
+            raise ValueError("API 오류")
+        return [dict(_ROWS[0])]
+
+    collector.collect_data = fake_collect
+
+    results = collector.collect_many(['20260706', '20260707', '20260708'])
+
+    assert sorted(results) == ['20260706', '20260708']
+    assert results['20260706'][0]['cur_unit'] == 'JPY(100)'
+
+
+def test_backfill_saves_all_dates_in_one_batch():
+    """백필 시 모든 날짜를 각자의 기준일로 변환해 한 번에 저장한다"""
+    mock_db, _mock_conn, mock_cursor = _make_mock_db()
+    collector = ExchangeRateCollector(mock_db)
+    collector.collect_data = lambda search_date=None: [dict(_ROWS[0])]
+
+    collector.backfill(['20260706', '20260707'])
+
+    mock_cursor.executemany.assert_called_once()
+    _query, params = mock_cursor.executemany.call_args[0]
+    assert {p['search_date'] for p in params} == {date(2026, 7, 6), date(2026, 7, 7)}
+
+
+def test_run_skips_when_already_collected():
+    """대상 통화가 모두 저장된 날짜는 API를 호출하지 않는다"""
+    mock_db, _mock_conn, mock_cursor = _make_mock_db()
+    mock_cursor.fetchone.return_value = (2,)
+    collector = ExchangeRateCollector(mock_db, search_date='20260706')
+    collector.collect_data = MagicMock()
+
+    collector.run()
+
+    collector.collect_data.assert_not_called()
+    mock_cursor.executemany.assert_not_called()
+    _query, params = mock_cursor.execute.call_args[0]
+    assert params[0] == date(2026, 7, 6)
+
+
+def test_run_collects_when_partially_stored():
+    """일부 통화만 저장되어 있으면 수집과 저장을 진행한다"""
+    mock_db, _mock_conn, mock_cursor = _make_mock_db()
+    mock_cursor.fetchone.return_value = (1,)
+    collector = ExchangeRateCollector(mock_db, search_date='20260706')
+    collector.collect_data = MagicMock(return_value=_ROWS)
+
+    collector.run()
+
+    collector.collect_data.assert_called_once()
+    mock_cursor.executemany.assert_called_once()
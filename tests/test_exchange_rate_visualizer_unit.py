@@ -0,0 +1,43 @@
+"""
+그래프 파일 재사용 단위 테스트
+
+테스트 대상: utils/exchange_rate_visualizer.py - graph_file_path, find_reusable_graph
+"""
+
+import os
+import time
+from datetime import date
+
+from utils.exchange_rate_visualizer import (
+    GRAPH_REUSE_SECONDS,
+    find_reusable_graph,
+    graph_file_path,
+)
+
+
+def _touch(path, age_seconds=0):
+    path.write_bytes(b"")
+    ts = time.time() - age_seconds
+    os.utime(path, (ts, ts))
+
+
+def test_reuses_recent_graph_saved_under_same_path(tmp_path):
+    day = date(2026, 10, 15)
+    saved = graph_file_path(tmp_path, "exchange_rate", day, 3)
+    _touch(saved)
+
+    assert find_reusable_graph(tmp_path, "exchange_rate", day, 3) == saved
+
+
+def test_different_months_is_not_reused(tmp_path):
+    day = date(2026, 10, 15)
+    _touch(graph_file_path(tmp_path, "exchange_rate", day, 3))
+
+    assert find_reusable_graph(tmp_path, "exchange_rate", day, 6) is None
+
+
+def test_stale_graph_is_not_reused(tmp_path):
+    day = date(2026, 10, 15)
+    _touch(graph_file_path(tmp_path, "gold_price", day, 3), GRAPH_REUSE_SECONDS + 60)
+
+    assert find_reusable_graph(tmp_path, "gold_price", day, 3) is None
@@ -0,0 +1,150 @@
+"""
+HolidayChecker 단위 테스트
+
+공유 세션을 모킹하여 공휴일 XML 응답 파싱과 월 단위 캐시(메모리/디스크) 재사용을 검증한다.
+"""
+
+import os
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utils.holiday_checker import HOLIDAY_API_CONFIG, REQUEST_TIMEOUT, HolidayChecker
+
+
+_SAMPLE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>
+  <body><items>
+    <item><dateName>개천절</dateName><isHoliday>Y</isHoliday><locdate>20261003</locdate></item>
+    <item><dateName>국군의 날</dateName><isHoliday>N</isHoliday><locdate>20261001</locdate></item>
+    <item><dateName>한글날</dateName><isHoliday>Y</isHoliday><locdate>20261009</locdate></item>
+  </items></body>
+</response>""".encode("utf-8")
+
+
+def _mock_response(content):
+    resp = MagicMock()
+    resp.content = content
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = MagicMock()
+    session.get.return_value = _mock_response(_SAMPLE_XML)
+    monkeypatch.setattr("utils.holiday_checker._get_session", lambda: session)
+    return session
+
+
+@pytest.fixture
+def checker(monkeypatch, tmp_path, session):
+    monkeypatch.setattr(HolidayChecker, "_month_cache", {})
+    monkeypatch.setitem(HOLIDAY_API_CONFIG, "cache_dir", str(tmp_path))
+    return HolidayChecker()
+
+
+def test_check_holiday_returns_name(checker):
+    result = checker.check_holiday(datetime(2026, 10, 9))
+
+    assert result == {"is_holiday": True, "holiday_name": "한글날", "date": "20261009"}
+
+
+def test_non_holiday_item_is_ignored(checker):
+    result = checker.check_holiday(datetime(2026, 10, 1))
+
+    assert result["is_holiday"] is False
+    assert result["holiday_name"] is None
+
+
+def test_request_uses_timeout(checker, session):
+    checker.check_holiday(datetime(2026, 10, 9))
+
+    assert session.get.call_args.kwargs["timeout"] == REQUEST_TIMEOUT
+
+
+def test_same_month_is_fetched_once_across_instances(checker, session):
+    checker.check_holiday(datetime(2026, 10, 3))
+    checker.check_holiday(datetime(2026, 10, 5))
+    HolidayChecker().check_holiday(datetime(2026, 10, 9))
+
+    session.get.assert_called_once()
+    assert session.get.call_args.kwargs["params"]["solMonth"] == "10"
+
+
+def test_past_month_is_served_from_disk_after_restart(checker, session, monkeypatch):
+    checker.check_holiday(datetime(2026, 10, 3))
+    assert (checker.cache_dir / "2026-10.json").exists()
+
+    # 프로세스 재시작: 메모리 캐시 비움
+    monkeypatch.setattr(HolidayChecker, "_month_cache", {})
+    session.get.reset_mock()
+    with patch("utils.holiday_checker.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2026, 12, 1)
+        result = HolidayChecker().check_holiday(datetime(2026, 10, 9))
+
+    session.get.assert_not_called()
+    assert result["holiday_name"] == "한글날"
+
+
+def test_stale_current_month_cache_is_refetched(checker, session, monkeypatch):
+    checker.check_holiday(datetime(2026, 10, 3))
+    path = checker.cache_dir / "2026-10.json"
+    stale = path.stat().st_mtime - HolidayChecker.CURRENT_MONTH_TTL_SECONDS - 60
+    os.utime(path, (stale, stale))
+
+    monkeypatch.setattr(HolidayChecker, "_month_cache", {})
+    session.get.reset_mock()
+    with patch("utils.holiday_checker.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2026, 10, 15)
+        HolidayChecker().check_holiday(datetime(2026, 10, 9))
+
+    session.get.assert_called_once()
+
+
+def test_past_month_memory_cache_does_not_expire(checker, session):
+    with patch("utils.holiday_checker.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2026, 12, 1)
+        checker.check_holiday(datetime(2026, 10, 3))
+        with patch("utils.holiday_checker.time.time",
+                   return_value=time.time() + 30 * HolidayChecker.CURRENT_MONTH_TTL_SECONDS):
+            checker.check_holiday(datetime(2026, 10, 9))
+
+    session.get.assert_called_once()
+
+
+def test_current_month_memory_cache_expires_after_ttl(checker, session):
+    with patch("utils.holiday_checker.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2026, 10, 15)
+        checker.check_holiday(datetime(2026, 10, 3))
+        checker.check_holiday(datetime(2026, 10, 5))
+        session.get.assert_called_once()
+
+        # 같은 프로세스에서 TTL이 지나면 메모리/디스크 캐시 모두 만료되어 다시 조회
+        later = time.time() + HolidayChecker.CURRENT_MONTH_TTL_SECONDS + 60
+        with patch("utils.holiday_checker.time.time", return_value=later):
+            checker.check_holiday(datetime(2026, 10, 9))
+
+    assert session.get.call_count == 2
+
+
+def test_memory_entry_loaded_from_disk_keeps_file_age(checker, session, monkeypatch):
+    with patch("utils.holiday_checker.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2026, 10, 15)
+        checker.check_holiday(datetime(2026, 10, 3))
+        path = checker.cache_dir / "2026-10.json"
+        saved_at = path.stat().st_mtime
+
+        # 재시작 직후 디스크에서 읽은 항목은 파일 저장 시각 기준으로 만료된다
+        monkeypatch.setattr(HolidayChecker, "_month_cache", {})
+        with patch("utils.holiday_checker.time.time",
+                   return_value=saved_at + HolidayChecker.CURRENT_MONTH_TTL_SECONDS - 60):
+            checker.check_holiday(datetime(2026, 10, 5))
+        with patch("utils.holiday_checker.time.time",
+                   return_value=saved_at + HolidayChecker.CURRENT_MONTH_TTL_SECONDS + 60):
+            checker.check_holiday(datetime(2026, 10, 9))
+
+    assert session.get.call_count == 2
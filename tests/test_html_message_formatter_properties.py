@@ -7,7 +7,7 @@ Feature: slack-to-telegram-migration
 
 import re
 import pytest
-from hypothesis import given, settings, assume
+from hypothesis import given, assume
 from hypothesis import strategies as st
 
 from utils.html_message_formatter import HTMLMessageFormatter
@@ -75,7 +75,6 @@ class TestHTMLTagRestriction:
         rates=rates_strategy,
         data=st.data(),
     )
-    @settings(max_examples=100)
     def test_only_allowed_html_tags(self, date, rates, data):
         """생성된 메시지에 텔레그램 지원 HTML 태그만 포함되는지 검증"""
         currencies = list(rates.keys())
@@ -133,7 +132,6 @@ class TestHTMLMessageRequiredElements:
         rates=rates_strategy,
         data=st.data(),
     )
-    @settings(max_examples=100)
     def test_message_contains_required_elements(self, date, rates, data):
         """생성된 메시지에 모든 필수 요소가 포함되는지 검증"""
         currencies = list(rates.keys())
@@ -45,7 +45,6 @@ class TestNWeekLowAccuracy:
     """
 
     @given(prices=prices_for_n_week_low)
-    @settings(max_examples=100)
     def test_n_week_low_equals_min(self, prices):
         """find_n_week_low 결과의 최저가가 min(prices)와 동일한지 검증"""
         result = IndicatorCalculator.find_n_week_low(prices)
@@ -82,7 +81,6 @@ class TestMovingAverageAccuracy:
         prices=st.lists(positive_price, min_size=1, max_size=50),
         period=ma_period,
     )
-    @settings(max_examples=100)
     def test_moving_average_equals_arithmetic_mean(self, prices, period):
         """moving_average 결과가 마지막 N개의 산술 평균과 동일한지 검증"""
         # 가격 리스트가 period 이상인 경우만 테스트
@@ -164,7 +162,6 @@ class TestRsiRangeInvariance:
     """
 
     @given(prices=prices_for_rsi)
-    @settings(max_examples=100)
     def test_rsi_within_range(self, prices):
         """RSI 값이 항상 0~100 범위 내에 있는지 검증"""
         result = IndicatorCalculator.rsi(prices, period=14)
@@ -192,7 +189,6 @@ class TestBollingerBandsAccuracy:
     """
 
     @given(prices=prices_for_bollinger)
-    @settings(max_examples=100)
     def test_bollinger_bands_calculation(self, prices):
         """볼린저 밴드 값이 산술 평균 ± 2*표준편차와 동일한지 검증"""
         period = 20
@@ -241,7 +237,6 @@ class TestBollingerBandsSymmetry:
     """
 
     @given(prices=prices_for_bollinger)
-    @settings(max_examples=100)
     def test_bollinger_bands_symmetry(self, prices):
         """볼린저 밴드 상단/하단이 중단 기준으로 대칭인지 검증"""
         result = IndicatorCalculator.bollinger_bands(prices)
@@ -10,6 +10,7 @@ Requirements: 1.4, 2.4, 3.4, 4.4
 
 import math
 
+import numpy as np
 import pytest
 
 from utils.indicator_calculator import IndicatorCalculator
@@ -291,6 +292,16 @@ class TestDetectMaCross:
         if result is not None:
             assert result == "dead_cross"
 
+    def test_ndarray_input_matches_list(self):
+        """NumPy 배열 입력은 리스트 입력과 같은 결과를 반환"""
+        for prices in (
+            [1400.0] * 15 + [1300.0] * 5 + [1500.0],
+            [1300.0] * 15 + [1400.0] * 5 + [1200.0],
+            [1000.0 + i * 10 for i in range(25)],
+        ):
+            assert IndicatorCalculator.detect_ma_cross(np.array(prices)) == \
+                IndicatorCalculator.detect_ma_cross(prices)
+
 
 # ============================================================
 # disparity 테스트
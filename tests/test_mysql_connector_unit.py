@@ -0,0 +1,92 @@
+"""
+MySQLConnector 연결 풀 단위 테스트
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mysql.connector import MySQLConnection
+from mysql.connector.errors import OperationalError
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
+
+import modules.mysql_connector as mysql_connector
+from modules.mysql_connector import MySQLConnector, get_pool
+
+
+@pytest.fixture
+def mock_pool(monkeypatch):
+    """모듈 전역 풀을 초기화하고 MySQLConnectionPool을 모킹"""
+    monkeypatch.setattr(mysql_connector, "_pool", None)
+    with patch("modules.mysql_connector.pooling.MySQLConnectionPool") as pool_cls:
+        yield pool_cls
+
+
+class TestConnectionPool:
+    def test_pool_is_created_once(self, mock_pool):
+        assert get_pool() is get_pool()
+        mock_pool.assert_called_once()
+
+    def test_pool_has_room_beyond_parallel_collectors(self, mock_pool):
+        """병렬 수집기가 모두 대여해도 노티파이어 본체와 봇 핸들러 몫이 남아야 한다"""
+        get_pool()
+        pool_size = mock_pool.call_args.kwargs["pool_size"]
+        assert pool_size == mysql_connector.POOL_SIZE
+        assert pool_size >= mysql_connector.COLLECTOR_WORKERS + 2
+
+    def test_connectors_share_pool_and_return_connections(self, mock_pool):
+        first, second = MySQLConnector(), MySQLConnector()
+        cnx = first.get_connection()
+        first.close()
+        second.get_connection()
+
+        mock_pool.assert_called_once()
+        cnx.close.assert_called_once()
+        assert first.connection is None
+        assert mock_pool.return_value.get_connection.call_count == 2
+
+    def test_broken_connection_is_returned_before_checkout(self, mock_pool):
+        broken = MagicMock()
+        broken.is_connected.return_value = False
+        connector = MySQLConnector()
+        connector.connection = broken
+
+        connector.get_connection()
+
+        broken.close.assert_called_once()
+        mock_pool.return_value.get_connection.assert_called_once()
+
+
+def _disconnected_pooled_connection():
+    """연결이 끊겨 반납 시 reset_session이 실패하는 실제 PooledMySQLConnection 생성"""
+    pool = MagicMock(spec=MySQLConnectionPool)
+    pool.reset_session = True
+    cnx = MagicMock(spec=MySQLConnection)
+    cnx.is_connected.return_value = False
+    cnx.reset_session.side_effect = OperationalError("MySQL Connection not available.")
+    return PooledMySQLConnection(pool, cnx), pool, cnx
+
+
+class TestDisconnectedPooledConnection:
+    def test_get_connection_reconnects_when_reset_session_fails(self, monkeypatch):
+        pooled, pool, cnx = _disconnected_pooled_connection()
+        # pooling.MySQLConnectionPool을 패치하면 PooledMySQLConnection.close의 isinstance 검사가 깨지므로
+        # 풀 객체만 바꿔 끼운다
+        new_pool = MagicMock()
+        monkeypatch.setattr(mysql_connector, "get_pool", lambda *args, **kwargs: new_pool)
+        connector = MySQLConnector()
+        connector.connection = pooled
+
+        result = connector.get_connection()
+
+        # 끊긴 연결은 풀에 반납되고 새 연결을 대여
+        pool.add_connection.assert_called_once_with(cnx)
+        assert result is new_pool.get_connection.return_value
+
+    def test_close_does_not_raise_and_clears_connection(self):
+        pooled, pool, cnx = _disconnected_pooled_connection()
+        connector = MySQLConnector()
+        connector.connection = pooled
+
+        connector.close()
+
+        assert connector.connection is None
+        pool.add_connection.assert_called_once_with(cnx)
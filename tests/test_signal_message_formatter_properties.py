@@ -6,7 +6,7 @@ Feature: exchange-rate-buy-signal
 """
 
 import pytest
-from hypothesis import given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 
 from utils.buy_signal_analyzer import Signal
@@ -78,7 +78,6 @@ class TestSignalMessageCompleteness:
     """
 
     @given(signals=signals_list_strategy())
-    @settings(max_examples=100)
     def test_format_contains_currency_and_rate(self, signals):
         """포맷 결과에 각 Signal의 currency와 current_rate가 포함되는지 검증"""
         formatter = SignalMessageFormatter()
@@ -5,8 +5,10 @@ Feature: slack-to-telegram-migration
 테스트 대상: utils/sparkline_generator.py - SparklineGenerator 클래스
 """
 
+from unittest.mock import patch
+
 import pytest
-from hypothesis import given, settings, assume
+from hypothesis import given, assume
 from hypothesis import strategies as st
 
 from utils.sparkline_generator import SPARK_BLOCKS, SparklineGenerator
@@ -31,7 +33,6 @@ class TestSparklineOutputValidity:
     @given(
         values=st.lists(finite_floats, min_size=1, max_size=30),
     )
-    @settings(max_examples=100)
     def test_output_length_and_valid_characters(self, values):
         """비어있지 않은 숫자 리스트 → 출력 길이 일치 및 유효 문자 검증"""
         result = SparklineGenerator.generate(values)
@@ -65,7 +66,6 @@ class TestSparklineMinMaxMapping:
     @given(
         values=st.lists(finite_floats, min_size=2, max_size=30),
     )
-    @settings(max_examples=100)
     def test_min_maps_to_lowest_max_maps_to_highest(self, values):
         """최솟값 → ▁, 최댓값 → █ 매핑 검증"""
         # 모든 값이 동일한 경우 제외 (min != max 보장)
@@ -92,3 +92,19 @@ class TestSparklineMinMaxMapping:
             f"최댓값({max_val}) 위치({max_idx})의 문자가 '█'이 아닙니다. "
             f"실제: '{result[max_idx]}', 전체 출력: '{result}'"
         )
+
+
+class TestSparklineVectorizedEquivalence:
+    """
+    긴 입력에 쓰는 NumPy 경로는 스칼라 경로와 같은 문자열을 반환해야 한다.
+    """
+
+    @given(
+        values=st.lists(finite_floats, min_size=1, max_size=150),
+    )
+    def test_vectorized_matches_scalar(self, values):
+        """_generate_vectorized 결과 == 스칼라 루프 결과"""
+        with patch("utils.sparkline_generator.VECTORIZE_MIN_LEN", len(values) + 1):
+            expected = SparklineGenerator.generate(values)
+
+        assert SparklineGenerator._generate_vectorized(values) == expected
@@ -8,7 +8,7 @@ Feature: slack-to-telegram-migration
 import os
 import json
 import pytest
-from hypothesis import given, settings, assume
+from hypothesis import given, assume
 from hypothesis import strategies as st
 from unittest.mock import patch, MagicMock, PropertyMock
 import requests
@@ -41,11 +41,9 @@ def _make_success_response():
 
 
 @pytest.fixture(autouse=True)
-def reset_singleton():
-    """각 테스트 전에 싱글톤 인스턴스를 초기화"""
-    TelegramSettings._instance = None
-    yield
-    TelegramSettings._instance = None
+def reset_singleton(monkeypatch):
+    """각 테스트 전에 싱글톤 인스턴스를 초기화 (종료 시 monkeypatch가 원래 값으로 복원)"""
+    monkeypatch.setattr(TelegramSettings, '_instance', None)
 
 
 def _create_sender():
@@ -78,7 +76,6 @@ class TestValidMessageSendsSuccessfully:
         text=non_empty_text,
         parse_mode=parse_mode_strategy,
     )
-    @settings(max_examples=100)
     def test_valid_message_sends_successfully(self, text, parse_mode):
         """유효한 메시지와 선택적 parse_mode로 전송 시 True 반환 및 올바른 엔드포인트 호출 검증"""
         sender = _create_sender()
@@ -132,7 +129,6 @@ class TestEmptyMessageRejection:
     @given(
         text=whitespace_text,
     )
-    @settings(max_examples=100)
     def test_empty_message_rejected(self, text):
         """공백 문자열 또는 빈 문자열 전송 시 False 반환 및 API 미호출 검증"""
         sender = _create_sender()
@@ -164,12 +160,13 @@ class TestApiFailureReturnsFalse:
         text=non_empty_text,
         status_code=st.sampled_from([400, 401, 403, 404, 429, 500, 502, 503]),
     )
-    @settings(max_examples=100)
     def test_api_failure_returns_false(self, text, status_code):
         """API 에러 응답 시 False 반환 검증"""
         sender = _create_sender()
 
-        with patch('modules.telegram_sender.requests.post') as mock_post:
+        # 429는 재시도 후 실패하므로 대기 시간은 건너뛴다
+        with patch('modules.telegram_sender.requests.post') as mock_post, \
+                patch('modules.telegram_sender.time.sleep'):
             # HTTP 에러 응답 시뮬레이션: raise_for_status()가 예외를 발생시킴
             mock_response = MagicMock()
             mock_response.status_code = status_code
@@ -207,7 +204,6 @@ class TestInvalidFilePathRejection:
             max_size=100,
         ).map(lambda s: f"/nonexistent/path/{s}.png"),
     )
-    @settings(max_examples=100)
     def test_invalid_file_path_rejected(self, text, file_path):
         """존재하지 않는 파일 경로 전달 시 False 반환 검증"""
         sender = _create_sender()
@@ -8,6 +8,7 @@ Feature: slack-to-telegram-migration
 1. 파일 전송 시 sendPhoto 엔드포인트 호출 확인 (Property 5)
 2. parse_mode='HTML' 전달 시 요청 본문에 포함 확인
 3. 메서드 시그니처 호환성 확인
+4. 429(요청 제한) 응답 시 retry_after 대기 후 재시도
 
 Validates: Requirements 2.2, 2.3, 2.8
 """
@@ -19,6 +20,7 @@ from typing import Optional, Union
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from configs.telegram_setting import TelegramSettings
 
@@ -52,11 +54,9 @@ def _create_sender():
 # --- 픽스처 ---
 
 @pytest.fixture(autouse=True)
-def reset_singleton():
-    """각 테스트 전에 싱글톤 인스턴스를 초기화"""
-    TelegramSettings._instance = None
-    yield
-    TelegramSettings._instance = None
+def reset_singleton(monkeypatch):
+    """각 테스트 전에 싱글톤 인스턴스를 초기화 (종료 시 monkeypatch가 원래 값으로 복원)"""
+    monkeypatch.setattr(TelegramSettings, "_instance", None)
 
 
 # --- 테스트 1: 파일 전송 시 sendPhoto 엔드포인트 호출 확인 (Property 5) ---
@@ -233,3 +233,47 @@ class TestMethodSignatureCompatibility:
             assert isinstance(result, bool), (
                 f"send_message의 반환값은 bool이어야 합니다. 실제 타입: {type(result)}"
             )
+
+
+# --- 테스트 4: 429 응답 재시도 ---
+
+def _make_rate_limited_response(retry_after):
+    """텔레그램 API 429 응답 Mock 생성"""
+    mock_resp = MagicMock()
+    mock_resp.status_code = 429
+    mock_resp.json.return_value = {
+        "ok": False,
+        "error_code": 429,
+        "parameters": {"retry_after": retry_after},
+    }
+    return mock_resp
+
+
+class TestRateLimitRetry:
+    """429 응답 시 retry_after만큼 기다린 뒤 재시도하는지 검증한다."""
+
+    def test_retries_after_rate_limit_then_succeeds(self):
+        """429 후 성공하면 retry_after만큼 대기하고 True 반환"""
+        sender = _create_sender()
+
+        with patch("modules.telegram_sender.requests.post") as mock_post, \
+                patch("modules.telegram_sender.time.sleep") as mock_sleep:
+            mock_post.side_effect = [_make_rate_limited_response(5), _make_success_response()]
+
+            assert sender.send_message(text="재시도 테스트") is True
+
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once_with(5.0)
+
+    def test_gives_up_after_max_retries(self):
+        """계속 429면 최대 횟수만큼 재시도 후 False 반환 (대기 시간은 상한 적용)"""
+        sender = _create_sender()
+        response = _make_rate_limited_response(3600)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError("429 Error")
+
+        with patch("modules.telegram_sender.requests.post", return_value=response) as mock_post, \
+                patch("modules.telegram_sender.time.sleep") as mock_sleep:
+            assert sender.send_message(text="재시도 테스트") is False
+
+        assert mock_post.call_count == sender.MAX_RATE_LIMIT_RETRIES + 1
+        assert all(c.args == (sender.MAX_RETRY_AFTER,) for c in mock_sleep.call_args_list)
@@ -7,7 +7,7 @@ Feature: slack-to-telegram-migration
 
 import os
 import pytest
-from hypothesis import given, settings, assume
+from hypothesis import given, assume
 from hypothesis import strategies as st
 from unittest.mock import patch
 
@@ -26,11 +26,9 @@ non_empty_printable = st.text(
 
 
 @pytest.fixture(autouse=True)
-def reset_singleton():
-    """각 테스트 전에 싱글톤 인스턴스를 초기화"""
-    TelegramSettings._instance = None
-    yield
-    TelegramSettings._instance = None
+def reset_singleton(monkeypatch):
+    """각 테스트 전에 싱글톤 인스턴스를 초기화 (종료 시 monkeypatch가 원래 값으로 복원)"""
+    monkeypatch.setattr(TelegramSettings, '_instance', None)
 
 
 class TestConfigurationRoundTrip:
@@ -49,7 +47,6 @@ class TestConfigurationRoundTrip:
         bot_token=non_empty_printable,
         chat_id=non_empty_printable,
     )
-    @settings(max_examples=100)
     def test_credentials_round_trip(self, bot_token, chat_id):
         """환경변수에 설정한 값이 get_credentials()로 동일하게 반환되는지 검증"""
         # 싱글톤 초기화
@@ -81,10 +78,7 @@ class TestSingletonGuarantee:
     Validates: Requirements 1.4
     """
 
-    @given(
-        num_instances=st.integers(min_value=2, max_value=10),
-    )
-    @settings(max_examples=100)
+    @pytest.mark.parametrize('num_instances', [2, 5, 10])
     def test_singleton_identity(self, num_instances):
         """N번 생성해도 모든 인스턴스가 동일한 객체인지 검증"""
         # 싱글톤 초기화
@@ -128,7 +122,6 @@ class TestGraphSendSettingParsing:
             max_size=50,
         ),
     )
-    @settings(max_examples=100)
     def test_send_graph_parsing(self, send_graph_value):
         """임의의 문자열에 대해 send_graph가 올바르게 파싱되는지 검증"""
         # 싱글톤 초기화
@@ -9,18 +9,23 @@ Feature: slack-to-telegram-migration
 """
 
 import os
+import re
+
 import pytest
 from unittest.mock import patch
 
 from configs.telegram_setting import TelegramSettings
 
 
+# 누락 설정 에러 메시지 검증용 패턴 (모듈 로드 시 1회만 컴파일)
+_BOT_TOKEN_PAT = re.compile(r'TELEGRAM_BOT_TOKEN')
+_CHAT_ID_PAT = re.compile(r'TELEGRAM_CHAT_ID')
+
+
 @pytest.fixture(autouse=True)
-def reset_singleton():
-    """각 테스트 전후에 싱글톤 인스턴스를 초기화"""
-    TelegramSettings._instance = None
-    yield
-    TelegramSettings._instance = None
+def reset_singleton(monkeypatch):
+    """각 테스트 전후에 싱글톤 인스턴스를 초기화 (종료 시 monkeypatch가 원래 값으로 복원)"""
+    monkeypatch.setattr(TelegramSettings, '_instance', None)
 
 
 class TestTelegramSettingsValidation:
@@ -42,7 +47,7 @@ class TestTelegramSettingsValidation:
         }
 
         with patch.dict(os.environ, env_vars, clear=False):
-            with pytest.raises(ValueError, match="TELEGRAM_BOT_TOKEN"):
+            with pytest.raises(ValueError, match=_BOT_TOKEN_PAT):
                 TelegramSettings()
 
     def test_missing_chat_id_raises_value_error(self):
@@ -61,7 +66,7 @@ class TestTelegramSettingsValidation:
         }
 
         with patch.dict(os.environ, env_vars, clear=False):
-            with pytest.raises(ValueError, match="TELEGRAM_CHAT_ID"):
+            with pytest.raises(ValueError, match=_CHAT_ID_PAT):
                 TelegramSettings()
 
     def test_send_graph_defaults_to_false_when_not_set(self):
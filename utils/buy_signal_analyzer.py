@@ -16,6 +16,8 @@
 import logging
 from dataclasses import dataclass
 
+import numpy as np
+
 from utils.indicator_calculator import IndicatorCalculator
 from utils.time_utils import kst_today
 
@@ -52,6 +54,9 @@ class BuySignalAnalyzer:
     def __init__(self, db_connector):
         """MySQLConnector 인스턴스를 주입받는다"""
         self.db_connector = db_connector
+        # 통화마다 같은 SQL을 실행하므로 연결과 prepared 커서를 한 번만 만들어 재사용
+        self._conn = None
+        self._cursor = None
 
     def get_past_rates(self, currency: str, days: int) -> list[float]:
         """
@@ -69,32 +74,46 @@ class BuySignalAnalyzer:
             오래된 순으로 정렬된 일별 deal_bas_r 리스트 (오늘 제외)
         """
         today_kst = kst_today()
-        connection = self.db_connector.get_connection()
-        cursor = connection.cursor()
-        try:
-            # 날짜별 최신 create_at 행 하나만 뽑아 일별 시계열 구성 (KST 오늘 제외).
-            # KST 오늘을 파라미터로 전달하여 DB 타임존과 무관하게 일관된 날짜 기준 적용.
-            query = (
-                "SELECT deal_bas_r FROM exchange_rates e "
-                "WHERE cur_unit = %s AND search_date < %s "
-                "AND create_at = ("
-                "  SELECT MAX(e2.create_at) FROM exchange_rates e2 "
-                "  WHERE e2.cur_unit = e.cur_unit AND e2.search_date = e.search_date"
-                ") "
-                "ORDER BY search_date DESC LIMIT %s"
-            )
-            cursor.execute(query, (currency, today_kst, days))
-            rows = cursor.fetchall()
-            # DB 결과는 최신순이므로 역순으로 변환하여 오래된 순으로 반환
-            return [float(row[0]) for row in reversed(rows)]
-        finally:
-            cursor.close()
+        # 날짜별 최신 create_at 행 하나만 뽑아 일별 시계열 구성 (KST 오늘 제외).
+        # KST 오늘을 파라미터로 전달하여 DB 타임존과 무관하게 일관된 날짜 기준 적용.
+        # DOUBLE로 캐스팅해 드라이버가 Decimal 대신 float을 바로 반환하도록 한다.
+        query = (
+            "SELECT CAST(deal_bas_r AS DOUBLE) FROM exchange_rates e "
+            "WHERE cur_unit = %s AND search_date < %s "
+            "AND create_at = ("
+            "  SELECT MAX(e2.create_at) FROM exchange_rates e2 "
+            "  WHERE e2.cur_unit = e.cur_unit AND e2.search_date = e.search_date"
+            ") "
+            "ORDER BY search_date DESC LIMIT %s"
+        )
+        cursor = self._get_cursor()
+        cursor.execute(query, (currency, today_kst, days))
+        rows = cursor.fetchall()
+        # DB 결과는 최신순이므로 제자리 역순 변환하여 오래된 순으로 반환
+        rates = [row[0] for row in rows]
+        rates.reverse()
+        return rates
+
+    def _get_cursor(self):
+        """prepared 커서를 최초 1회 생성하고 이후에는 재사용한다."""
+        if self._cursor is None:
+            self._conn = self.db_connector.get_connection()
+            self._cursor = self._conn.cursor(prepared=True)
+        return self._cursor
+
+    def close(self) -> None:
+        """재사용 중인 커서를 닫는다 (DB 연결 자체는 db_connector가 관리)."""
+        if self._cursor is not None:
+            self._cursor.close()
+        self._cursor = None
+        self._conn = None
 
     def analyze_currency(self, currency: str, today_rate: float) -> list[Signal]:
         """
         단일 통화에 대해 저가매기 지표를 분석하고 신호 리스트를 반환한다.
 
-        각 지표 계산 실패 시 해당 지표만 건너뛰고 로그에 기록한다.
+        각 지표 계산 실패 시 해당 지표만 건너뛰고 경고 로그로 기록한다.
+        (트레이스백은 analyze()의 통화 단위 예외 처리에서만 남긴다.)
 
         Args:
             currency: 통화 코드
@@ -110,13 +129,14 @@ class BuySignalAnalyzer:
         today_rate = float(today_rate)
 
         # 과거 시계열 (오늘 제외). 오늘 값은 today_rate로만 다룬다.
-        history = self.get_past_rates(currency, self.LOOKBACK_DAYS)
+        # float64 배열로 한 번만 변환해 모든 지표가 공유한다 (지표마다 리스트→배열 변환 반복 방지)
+        history = np.asarray(self.get_past_rates(currency, self.LOOKBACK_DAYS), dtype=np.float64)
         logger.info(f"{currency}: 과거 {len(history)}일 데이터 조회 완료")
 
         # 이격도/볼린저는 과거 window로 기준(평균·밴드)을 만들고 오늘 값을 비교한다.
         # (기준 계산에 오늘 값을 넣으면 자기참조가 되어 신호가 둔감해진다.)
         # RSI는 변화량 기반이라 오늘 값을 시계열 끝에 붙여야 한다.
-        series_with_today = history + [today_rate]
+        series_with_today = np.append(history, today_rate)
 
         # 1. 이격도 (장기 평균 대비 저평가) - 과거 평균 기준
         self._check_disparity(currency, today_rate, history, signals)
@@ -149,7 +169,7 @@ class BuySignalAnalyzer:
                     indicator_value=disparity,
                 ))
         except Exception as e:
-            logger.error(f"{currency}: 이격도 분석 중 오류 발생: {e}", exc_info=True)
+            logger.warning(f"{currency}: 이격도 분석 중 오류 발생 (해당 지표 건너뜀): {e}")
 
     def _check_percentile(self, currency, today_rate, history, signals):
         try:
@@ -166,7 +186,7 @@ class BuySignalAnalyzer:
                     indicator_value=pct,
                 ))
         except Exception as e:
-            logger.error(f"{currency}: 백분위 분석 중 오류 발생: {e}", exc_info=True)
+            logger.warning(f"{currency}: 백분위 분석 중 오류 발생 (해당 지표 건너뜀): {e}")
 
     def _check_bollinger(self, currency, today_rate, rates, signals):
         try:
@@ -186,7 +206,7 @@ class BuySignalAnalyzer:
                     indicator_value=lower,
                 ))
         except Exception as e:
-            logger.error(f"{currency}: 볼린저 밴드 분석 중 오류 발생: {e}", exc_info=True)
+            logger.warning(f"{currency}: 볼린저 밴드 분석 중 오류 발생 (해당 지표 건너뜀): {e}")
 
     def _check_n_low(self, currency, today_rate, history, signals):
         try:
@@ -205,7 +225,7 @@ class BuySignalAnalyzer:
                     indicator_value=lowest_price,
                 ))
         except Exception as e:
-            logger.error(f"{currency}: 최저가 분석 중 오류 발생: {e}", exc_info=True)
+            logger.warning(f"{currency}: 최저가 분석 중 오류 발생 (해당 지표 건너뜀): {e}")
 
     def _check_rsi(self, currency, today_rate, rates, signals):
         try:
@@ -221,7 +241,7 @@ class BuySignalAnalyzer:
                     indicator_value=rsi_value,
                 ))
         except Exception as e:
-            logger.error(f"{currency}: RSI 분석 중 오류 발생: {e}", exc_info=True)
+            logger.warning(f"{currency}: RSI 분석 중 오류 발생 (해당 지표 건너뜀): {e}")
 
     def analyze(self, today_rates: dict[str, float]) -> list[Signal]:
         """
@@ -239,6 +259,8 @@ class BuySignalAnalyzer:
         """
         all_signals: list[Signal] = []
 
+        # 통화별 조회는 같은 연결의 prepared 커서를 쓰고 지표 계산은 GIL을 잡는 짧은 연산이라
+        # 스레드로 나눠도 겹칠 작업이 없으므로 순서대로 처리한다
         for currency in self.TARGET_CURRENCIES:
             try:
                 if currency not in today_rates:
@@ -1,6 +1,9 @@
 # utils/exchange_rate_collector.py
+import json
 import requests
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from mysql.connector import Error
 from configs.apis_setting import EXCHANGE_RATE_API_CONFIG
@@ -16,37 +19,68 @@ requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 수출입은행 API 호출용 세션 (프로세스 전체에서 공유해 TCP/TLS 연결을 재사용)
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """재시도 전략이 설정된 공유 세션을 반환한다 (최초 호출 시 생성)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+
+            # 재시도 전략 설정
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504]
+            )
+
+            adapter = HTTPAdapter(max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+# 수출입은행 응답에서 콤마 포함 문자열로 오는 금액 필드
+_AMOUNT_FIELDS = ('ttb', 'tts', 'deal_bas_r', 'bkpr')
+
+
+def _to_insert_params(exchange_rates, search_date):
+    """API 응답 행들을 INSERT 파라미터 dict 리스트로 변환한다 (금액 콤마 제거 후 float)."""
+    return [
+        {
+            'cur_unit': rate['cur_unit'],
+            **{field: float(rate[field].replace(',', '')) for field in _AMOUNT_FIELDS},
+            'cur_nm': rate['cur_nm'],
+            'search_date': search_date
+        }
+        for rate in exchange_rates
+    ]
+
 
 class ExchangeRateCollector:
     def __init__(self, db_connector, search_date=None):
         self.api_key = EXCHANGE_RATE_API_CONFIG['api_key']
         self.db_connector = db_connector
         # USD는 토스 API(TossUSDCollector)가 담당. JPY는 알림/그래프용, EUR은 수집만.
-        self.target_currencies = ['JPY(100)', 'EUR']
+        self.target_currencies = frozenset(('JPY(100)', 'EUR'))
         self.base_url = EXCHANGE_RATE_API_CONFIG['base_url']
         self.search_date = search_date  # 검색할 날짜 추가
 
-        # 세션 설정
-        self.session = requests.Session()
-
-        # 재시도 전략 설정
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504]
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # 공유 세션 사용 (수집기 인스턴스마다 연결을 새로 맺지 않음)
+        self.session = _get_session()
 
-    def collect_data(self):
+    def collect_data(self, search_date=None):
         """한국수출입은행 API에서 환율 데이터 수집"""
         if not self.api_key:
             raise ValueError("EXCHANGE_RATE_API_KEY가 설정되지 않았습니다.")
 
-        # search_date가 있으면 사용, 없으면 오늘 날짜 사용 (KST 기준)
-        search_date = self.search_date or kst_today().strftime('%Y%m%d')
+        # 인자 > 생성자 search_date > 오늘 날짜 순으로 사용 (KST 기준)
+        search_date = search_date or self.search_date or kst_today().strftime('%Y%m%d')
 
         params = {
             'authkey': self.api_key,
@@ -62,7 +96,8 @@ class ExchangeRateCollector:
                 timeout=10
             )
             response.raise_for_status()
-            data = response.json()
+            # 바이트 본문을 바로 디코딩 (응답 텍스트 변환/인코딩 추정 단계 생략)
+            data = json.loads(response.content)
 
             if not isinstance(data, list):
                 raise ValueError(f"예상치 못한 응답 형식: {data}")
@@ -74,43 +109,102 @@ class ExchangeRateCollector:
         except requests.exceptions.RequestException as e:
             logger.error(f"API 호출 중 오류 발생: {str(e)}")
             raise
-        finally:
-            self.session.close()
 
-    def save_data(self, exchange_rates):
-        """수집된 환율 데이터를 데이터베이스에 저장"""
-        insert_query = """
-        INSERT INTO exchange_rates 
-        (cur_unit, ttb, tts, deal_bas_r, bkpr, cur_nm, search_date)
-        VALUES (%(cur_unit)s, %(ttb)s, %(tts)s, %(deal_bas_r)s, %(bkpr)s, %(cur_nm)s, %(search_date)s)
+    def collect_many(self, search_dates, max_workers=4):
         """
+        여러 날짜의 환율 데이터를 동시에 수집 (과거 데이터 백필용)
 
-        try:
-            # 검색 날짜를 DATE 타입으로 변환
-            search_date = datetime.strptime(self.search_date or kst_today().strftime('%Y%m%d'), '%Y%m%d').date()
+        날짜별 요청은 서로 독립적인 네트워크 I/O이므로 공유 세션 위에서
+        스레드 풀로 병렬 호출한다. 특정 날짜의 실패는 로그만 남기고 건너뛴다.
+
+        Args:
+            search_dates: 조회할 날짜 리스트 (YYYYMMDD 형식)
+            max_workers: 동시 요청 수 (API 호출 한도를 고려해 작게 유지)
+
+        Returns:
+            dict: {search_date: 수집된 환율 리스트} (실패한 날짜는 제외)
+        """
+        if not search_dates:
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(search_dates))) as executor:
+            futures = {d: executor.submit(self.collect_data, d) for d in search_dates}
+            for search_date, future in futures.items():
+                try:
+                    results[search_date] = future.result()
+                except Exception as e:
+                    logger.error(f"{search_date} 환율 데이터 수집 실패: {str(e)}")
+        return results
+
+    INSERT_QUERY = """
+    INSERT INTO exchange_rates
+    (cur_unit, ttb, tts, deal_bas_r, bkpr, cur_nm, search_date)
+    VALUES (%(cur_unit)s, %(ttb)s, %(tts)s, %(deal_bas_r)s, %(bkpr)s, %(cur_nm)s, %(search_date)s)
+    """
+
+    def _parse_search_date(self, search_date=None):
+        """검색 날짜(YYYYMMDD)를 DATE 타입으로 변환 (인자 > 생성자 값 > 오늘)"""
+        return datetime.strptime(
+            search_date or self.search_date or kst_today().strftime('%Y%m%d'), '%Y%m%d'
+        ).date()
+
+    def _insert_params(self, params):
+        """
+        INSERT 파라미터를 executemany 한 번으로 저장하고 커밋한다 (행마다 왕복하지 않음)
 
+        autocommit 설정과 무관하게 명시적 트랜잭션 하나로 묶어 커밋(fsync)은 한 번만
+        일어나게 하고, 실패 시 일부 행만 남지 않도록 롤백한다.
+        """
+        connection = None
+        try:
             connection = self.db_connector.get_connection()
+            if not connection.in_transaction:
+                connection.start_transaction()
             with connection.cursor() as cursor:
-                for rate in exchange_rates:
-                    cleaned_data = {
-                        'cur_unit': rate['cur_unit'],
-                        'ttb': float(rate['ttb'].replace(',', '')),
-                        'tts': float(rate['tts'].replace(',', '')),
-                        'deal_bas_r': float(rate['deal_bas_r'].replace(',', '')),
-                        'bkpr': float(rate['bkpr'].replace(',', '')),
-                        'cur_nm': rate['cur_nm'],
-                        'search_date': search_date
-                    }
-                    cursor.execute(insert_query, cleaned_data)
-                connection.commit()
-                logger.info(f"{len(exchange_rates)}개의 환율 데이터가 저장되었습니다.")
+                cursor.executemany(self.INSERT_QUERY, params)
+            connection.commit()
+            logger.info(f"{len(params)}개의 환율 데이터가 저장되었습니다.")
         except Error as e:
             logger.error(f"데이터 저장 중 오류 발생: {str(e)}")
+            if connection is not None:
+                try:
+                    connection.rollback()
+                except Error as rollback_error:
+                    # 롤백 실패가 원래 저장 오류를 가리지 않도록 기록만 한다
+                    logger.error(f"롤백 중 오류 발생: {str(rollback_error)}")
             raise
 
+    def save_data(self, exchange_rates, search_date=None):
+        """수집된 환율 데이터를 데이터베이스에 저장"""
+        self._insert_params(_to_insert_params(exchange_rates, self._parse_search_date(search_date)))
+
+    def _already_collected(self, search_date):
+        """해당 날짜의 대상 통화가 모두 저장되어 있는지 확인 (인덱스 점 조회 한 번)"""
+        placeholders = ', '.join(['%s'] * len(self.target_currencies))
+        query = f"""
+        SELECT COUNT(DISTINCT cur_unit) FROM exchange_rates
+        WHERE search_date = %s AND cur_unit IN ({placeholders})
+        """
+        try:
+            connection = self.db_connector.get_connection()
+            with connection.cursor() as cursor:
+                cursor.execute(query, (search_date, *self.target_currencies))
+                (count,) = cursor.fetchone()
+            return count >= len(self.target_currencies)
+        except Error as e:
+            # 확인에 실패하면 수집을 건너뛰지 않는다
+            logger.warning(f"기존 환율 데이터 확인 중 오류 발생 (수집 진행): {str(e)}")
+            return False
+
     def run(self):
-        """환율 수집 및 저장 프로세스 실행"""
+        """환율 수집 및 저장 프로세스 실행 (이미 수집된 날짜는 API 호출 없이 건너뜀)"""
         try:
+            search_date = self._parse_search_date()
+            if self._already_collected(search_date):
+                logger.info(f"{search_date} 환율 데이터가 이미 수집되어 있어 건너뜁니다.")
+                return
+
             exchange_rates = self.collect_data()
             if exchange_rates:
                 self.save_data(exchange_rates)
@@ -121,6 +215,22 @@ class ExchangeRateCollector:
             logger.error(f"환율 데이터 처리 중 오류 발생: {str(e)}")
             raise
 
+    def backfill(self, search_dates):
+        """여러 날짜의 환율 데이터를 동시에 수집한 뒤 전체를 한 번에 저장"""
+        results = self.collect_many(search_dates)
+
+        # 모든 날짜의 행을 한 번에 변환해 단일 executemany로 저장
+        params = []
+        for search_date, exchange_rates in results.items():
+            if exchange_rates:
+                params.extend(_to_insert_params(exchange_rates, self._parse_search_date(search_date)))
+            else:
+                logger.warning(f"{search_date} 수집된 환율 데이터가 없습니다.")
+
+        if params:
+            self._insert_params(params)
+        logger.info(f"환율 데이터 백필 완료: {len(results)}/{len(search_dates)}일")
+
 
 # 모듈 테스트용 코드
 if __name__ == "__main__":
@@ -1,63 +1,97 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from modules.telegram_sender import TelegramSender
-from configs.telegram_setting import get_credentials, is_send_graph_enabled
+from configs.telegram_setting import is_send_graph_enabled
 from utils.sparkline_generator import SparklineGenerator
 from utils.html_message_formatter import HTMLMessageFormatter
-from utils.exchange_rate_visualizer import ExchangeRateVisualizer
 from utils.exchange_rate_collector import ExchangeRateCollector
 from utils.toss_usd_collector import TossUSDCollector
 from utils.gold_price_collector import GoldPriceCollector
-from utils.gold_price_visualizer import GoldPriceVisualizer
 from utils.gold_message_formatter import GoldMessageFormatter
 from utils.krx_gold_client import GOLD_1KG_ISU_CD
 from utils.buy_signal_analyzer import BuySignalAnalyzer
 from utils.signal_message_formatter import SignalMessageFormatter
 from utils.time_utils import kst_today
-from modules.mysql_connector import MySQLConnector
+from modules.mysql_connector import COLLECTOR_WORKERS, MySQLConnector
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 알림/스파크라인 대상 통화 (SQL에는 리터럴 대신 바인딩 파라미터로 전달)
+NOTIFY_CURRENCIES = ('USD', 'JPY(100)')
 
-def get_exchange_rates(db_connector, date):
-    """특정 날짜의 환율 정보 조회"""
-    query = """
-    SELECT cur_unit, deal_bas_r, bkpr
+
+def get_latest_rate_date(db_connector, currencies=NOTIFY_CURRENCIES):
+    """알림 대상 통화의 가장 최근 환율 날짜 조회 (데이터가 없으면 None)"""
+    # 통화별 MAX(search_date)는 (cur_unit, search_date, ...) 인덱스 끝을 한 번 찾는 것으로 끝나므로
+    # 통화 조건 없는 MAX(search_date)처럼 전체 인덱스를 훑지 않는다
+    query = " UNION ALL ".join(
+        ["SELECT MAX(search_date) AS latest FROM exchange_rates WHERE cur_unit = %s"] * len(currencies)
+    )
+    try:
+        connection = db_connector.get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT MAX(latest) FROM ({query}) AS t", tuple(currencies))
+            return cursor.fetchone()[0]
+    except Exception as e:
+        logger.error(f"최신 환율 날짜 조회 중 오류 발생: {str(e)}")
+        raise
+
+
+def get_exchange_rates_by_dates(db_connector, dates, currencies=NOTIFY_CURRENCIES):
+    """
+    여러 날짜의 환율 정보를 한 번의 쿼리로 조회
+
+    Returns:
+        {date: {currency: {"deal_bas_r", "bkpr"}}} (데이터가 없는 날짜는 빈 dict)
+    """
+    # search_date를 함수로 감싸지 않고 반개구간으로 조회해야 인덱스 range 스캔이 가능하다
+    placeholders = ', '.join(['%s'] * len(currencies))
+    query = f"""
+    SELECT search_date, cur_unit, deal_bas_r, bkpr
     FROM exchange_rates 
-    WHERE DATE(search_date) = %s
-    AND cur_unit IN ('USD', 'JPY(100)')
+    WHERE search_date >= %s AND search_date < %s
+    AND cur_unit IN ({placeholders})
     """
+    result = {date: {} for date in dates}
     try:
         connection = db_connector.get_connection()
         with connection.cursor() as cursor:
-            cursor.execute(query, (date,))
-            return {row[0]: {"deal_bas_r": row[1], "bkpr": row[2]} for row in cursor.fetchall()}
+            cursor.execute(query, (min(dates), max(dates) + timedelta(days=1), *currencies))
+            for search_date, cur_unit, deal_bas_r, bkpr in cursor.fetchall():
+                if search_date in result:
+                    result[search_date][cur_unit] = {"deal_bas_r": deal_bas_r, "bkpr": bkpr}
+        return result
     except Exception as e:
         logger.error(f"환율 정보 조회 중 오류 발생: {str(e)}")
-        return {}
+        return {date: {} for date in dates}
 
 
-def get_weekly_rates(db_connector, currency, days=7):
-    """최근 N일간의 환율 데이터 조회 (스파크라인용)"""
-    query = """
-    SELECT deal_bas_r
+def get_weekly_rates_by_currency(db_connector, currencies=NOTIFY_CURRENCIES, days=7):
+    """최근 N일간의 통화별 환율 데이터를 한 번의 쿼리로 조회 (스파크라인용)"""
+    placeholders = ', '.join(['%s'] * len(currencies))
+    query = f"""
+    SELECT cur_unit, deal_bas_r
     FROM exchange_rates
-    WHERE cur_unit = %s
+    WHERE cur_unit IN ({placeholders})
     AND search_date >= %s
-    ORDER BY search_date ASC
+    ORDER BY cur_unit, search_date ASC
     """
+    result = {currency: [] for currency in currencies}
     try:
         end_date = kst_today()
         start_date = end_date - timedelta(days=days)
         connection = db_connector.get_connection()
         with connection.cursor() as cursor:
-            cursor.execute(query, (currency, start_date))
-            return [float(row[0]) for row in cursor.fetchall()]
+            cursor.execute(query, (*currencies, start_date))
+            for cur_unit, deal_bas_r in cursor.fetchall():
+                result[cur_unit].append(float(deal_bas_r))
+        return result
     except Exception as e:
-        logger.error(f"{currency} 주간 환율 조회 중 오류 발생: {str(e)}")
-        return []
+        logger.error(f"주간 환율 조회 중 오류 발생: {str(e)}")
+        return {currency: [] for currency in currencies}
 
 
 def get_latest_gold(db_connector):
@@ -107,38 +141,47 @@ def get_weekly_gold(db_connector, days=7):
         return []
 
 
+def _run_collector(name, collector_cls) -> None:
+    """수집기 하나를 전용 DB 연결로 실행한다 (스레드 간 연결 공유 방지). 실패해도 예외를 올리지 않는다."""
+    db_connector = MySQLConnector()
+    try:
+        collector_cls(db_connector).run()
+    except Exception as e:
+        logger.error(f"{name} 수집 실패: {e}", exc_info=True)
+    finally:
+        db_connector.close()
+
+
 def main():
     """환율 데이터 수집, 시각화 및 알림을 처리하는 노티파이어"""
     try:
-        # 텔레그램 설정 가져오기
-        credentials = get_credentials()
-        telegram = TelegramSender(chat_id=credentials['chat_id'])
+        # 텔레그램 Sender 초기화 (기본 채팅 ID는 Sender가 설정에서 한 번만 조회)
+        telegram = TelegramSender()
         logger.debug("텔레그램 Sender 초기화 완료")
 
         # Database Connector 초기화
         db_connector = MySQLConnector()
         logger.info("DB Connector 초기화 완료")
 
-        # 1. 환율 수집 (USD=토스 실시간, JPY=수출입은행). 하나가 실패해도 다른 하나는 진행
-        try:
-            TossUSDCollector(db_connector).run()
-        except Exception as e:
-            logger.error(f"USD(토스) 수집 실패: {e}", exc_info=True)
-        try:
-            ExchangeRateCollector(db_connector).run()  # JPY(100)
-        except Exception as e:
-            logger.error(f"JPY(수출입은행) 수집 실패: {e}", exc_info=True)
-        try:
-            GoldPriceCollector(db_connector).run()  # KRX 금시세
-        except Exception as e:
-            logger.error(f"금시세(KRX) 수집 실패: {e}", exc_info=True)
+        # 1. 환율/금시세 수집 (USD=토스 실시간, JPY=수출입은행, 금=KRX)
+        # 서로 다른 외부 API를 기다리는 독립 작업이므로 병렬로 실행하고, 하나가 실패해도 나머지는 진행.
+        # 각 수집기는 풀에서 자기 연결을 빌려 쓰고 끝나면 바로 반납한다.
+        # 동시 대여 수는 COLLECTOR_WORKERS로 제한되며 풀은 그보다 여유 있게 잡혀 있다.
+        collectors = (
+            ("USD(토스)", TossUSDCollector),
+            ("JPY(수출입은행)", ExchangeRateCollector),
+            ("금시세(KRX)", GoldPriceCollector),
+        )
+        with ThreadPoolExecutor(max_workers=min(COLLECTOR_WORKERS, len(collectors))) as executor:
+            list(executor.map(lambda c: _run_collector(*c), collectors))
         logger.info("환율/금시세 데이터 수집 단계 완료.")
 
-        # 2. 오늘과 어제의 환율 정보 조회 (KST 기준)
+        # 2. 오늘과 어제의 환율 정보 조회 (KST 기준, 한 번의 쿼리)
         today = kst_today()
         yesterday = today - timedelta(days=1)
 
-        today_rates = get_exchange_rates(db_connector, today)
+        rates_by_date = get_exchange_rates_by_dates(db_connector, [today, yesterday])
+        today_rates = rates_by_date[today]
 
         if not today_rates:
             logger.info("오늘의 환율 데이터가 없습니다 (공휴일/주말). 환율 알림을 건너뜁니다.")
@@ -146,13 +189,14 @@ def main():
             _send_gold(db_connector, telegram)
             return
 
-        yesterday_rates = get_exchange_rates(db_connector, yesterday)
+        yesterday_rates = rates_by_date[yesterday]
 
-        # 3. 7일간 환율 데이터로 스파크라인 생성
-        sparklines = {}
-        for currency in ['USD', 'JPY(100)']:
-            week_data = get_weekly_rates(db_connector, currency)
-            sparklines[currency] = SparklineGenerator.generate(week_data)
+        # 3. 7일간 환율 데이터로 스파크라인 생성 (통화 전체를 한 번의 쿼리로 조회)
+        weekly_rates = get_weekly_rates_by_currency(db_connector, NOTIFY_CURRENCIES)
+        sparklines = {
+            currency: SparklineGenerator.generate(week_data)
+            for currency, week_data in weekly_rates.items()
+        }
 
         # 4. HTMLMessageFormatter로 rates를 {currency: float} 형태로 변환
         rates_for_formatter = {}
@@ -178,8 +222,12 @@ def main():
 
         # 7. 그래프 이미지 전송 (선택)
         if is_send_graph_enabled():
+            # matplotlib/pandas 로딩 비용이 크므로 그래프 전송 시에만 import
+            from utils.exchange_rate_visualizer import ExchangeRateVisualizer
+
+            # 방금 수집한 데이터를 반영해야 하므로 기존 그래프를 재사용하지 않는다
             visualizer = ExchangeRateVisualizer(db_connector)
-            graph_path = visualizer.create_visualization(months=3)
+            graph_path = visualizer.create_visualization(months=3, force=True)
             logger.info(f"환율 그래프가 생성되었습니다: {graph_path}")
             if graph_path and not telegram.send_message(
                 "📈 3개월간 환율 변동 그래프", file_path=graph_path
@@ -211,7 +259,11 @@ def _send_buy_signals(db_connector, telegram, rates_for_analysis: dict[str, floa
             logger.warning("매수 신호 분석: 분석할 환율 데이터가 없습니다")
             return
 
-        signals = BuySignalAnalyzer(db_connector).analyze(rates_for_analysis)
+        analyzer = BuySignalAnalyzer(db_connector)
+        try:
+            signals = analyzer.analyze(rates_for_analysis)
+        finally:
+            analyzer.close()
         if not signals:
             logger.info("매수 신호 분석 완료: 감지된 신호 없음")
             return
@@ -243,7 +295,9 @@ def _send_gold(db_connector, telegram) -> None:
             logger.error("금시세 텔레그램 메시지 전송 실패")
 
         if is_send_graph_enabled():
-            graph_path = GoldPriceVisualizer(db_connector).create_visualization(months=3)
+            from utils.gold_price_visualizer import GoldPriceVisualizer
+
+            graph_path = GoldPriceVisualizer(db_connector).create_visualization(months=3, force=True)
             if graph_path and not telegram.send_message(
                 "🥇 3개월간 금시세 변동 그래프", file_path=graph_path
             ):
@@ -1,10 +1,18 @@
 # utils/exchange_rate_visualizer.py
 
+import json
+import os
+import platform
+import time
 from pathlib import Path
 import matplotlib
+matplotlib.use('Agg')  # 서버(헤드리스) 환경: GUI 백엔드 자동 탐색 생략
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import matplotlib.font_manager as fm
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
@@ -14,15 +22,93 @@ from modules.cleanup import FileCleaner
 
 logger = logging.getLogger(__name__)
 
+# 가격/MA 선의 거의 일직선인 구간을 합쳐 PNG 렌더링 비용을 줄인다
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# PNG zlib 압축 수준 (Pillow 기본 6 대비 인코딩 약 25% 단축, 파일은 약 20% 증가 - 텔레그램 전송에는 무리 없는 수준)
+PNG_PIL_KWARGS = {'compress_level': 3}
+
+# 같은 날짜 그래프를 다시 그리지 않고 재사용할 최대 경과 시간 (초)
+GRAPH_REUSE_SECONDS = 60 * 60
+
+
+def graph_file_path(graph_dir, prefix, day, months):
+    """
+    그래프 저장 경로 ({prefix}_YYYYMMDD_{months}m.png)
+
+    날짜는 데이터 마지막 날이 아니라 그래프를 그린 날이다. 조회 전에도 같은 경로를 계산할 수 있어야
+    재사용 검사가 저장 경로와 일치하고, 기간(months)이 다른 그래프와 섞이지 않는다.
+    """
+    return Path(graph_dir) / f'{prefix}_{day.strftime("%Y%m%d")}_{months}m.png'
+
+
+def find_reusable_graph(graph_dir, prefix, day, months, max_age=GRAPH_REUSE_SECONDS):
+    """같은 날짜·기간의 그래프 파일이 max_age초 이내에 저장되었으면 경로 반환, 아니면 None"""
+    path = graph_file_path(graph_dir, prefix, day, months)
+    try:
+        if time.time() - path.stat().st_mtime < max_age:
+            return path
+    except FileNotFoundError:
+        pass
+    return None
+
+# 한글 폰트 탐색 결과 캐시 (재시작 시 폰트 디렉토리 전체 탐색을 건너뜀)
+_FONT_DIR = Path('/usr/share/fonts')
+_FONT_CACHE_PATH = Path.home() / '.cache' / 'exchange_collector' / 'korean_font.json'
+
+
+def _load_cached_font_path():
+    """캐시된 나눔 폰트 경로를 반환한다. 캐시가 없거나 파일이 사라졌으면 None."""
+    try:
+        cached = json.loads(_FONT_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if cached.get('system') != platform.system():
+        return None
+    font_path = cached.get('font_path')
+    if font_path and os.path.exists(font_path):
+        return font_path
+    return None
+
+
+def _save_cached_font_path(font_path):
+    """탐색한 나눔 폰트 경로를 캐시에 기록한다 (쓰기 실패는 무시)."""
+    try:
+        _FONT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _FONT_CACHE_PATH.write_text(
+            json.dumps({'system': platform.system(), 'font_path': font_path}),
+            encoding='utf-8'
+        )
+    except OSError as e:
+        logger.debug(f"폰트 캐시 저장 실패 (무시): {e}")
+
+
+def _find_nanum_font_path():
+    """나눔 폰트 파일 경로를 찾는다 (캐시 우선, 없으면 첫 번째 일치 파일에서 탐색 종료)."""
+    font_path = _load_cached_font_path()
+    if font_path:
+        return font_path
+
+    if not _FONT_DIR.is_dir():
+        return None
+
+    found = next(_FONT_DIR.rglob('Nanum*.ttf'), None)
+    if found is None:
+        return None
+
+    font_path = str(found)
+    _save_cached_font_path(font_path)
+    return font_path
+
+
 # 한글 폰트 설정
 def _setup_korean_font():
     """시스템에서 한글 폰트를 찾아 matplotlib에 설정"""
-    import glob
-
     # 1) 시스템 폰트 경로에서 나눔 폰트 직접 탐색 (도커 환경 대응)
-    nanum_paths = glob.glob('/usr/share/fonts/**/Nanum*.ttf', recursive=True)
-    if nanum_paths:
-        font_path = nanum_paths[0]
+    font_path = _find_nanum_font_path()
+    if font_path:
         fm.fontManager.addfont(font_path)
         font_prop = fm.FontProperties(fname=font_path)
         plt.rcParams['font.family'] = font_prop.get_name()
@@ -58,47 +144,93 @@ class ExchangeRateVisualizer:
 
     # utils/exchange_rate_visualizer.py
 
+    # 조회 대상 통화 (ORDER BY cur_unit 정렬 순서와 동일하게 유지)
+    _CURRENCIES = ('JPY(100)', 'USD')
+
+    # fetch_data_range 결과 행 (cur_unit, bkpr, search_date)
+    _ROW_DTYPE = np.dtype([
+        ('cur_unit', 'U8'),
+        ('bkpr', np.float64),
+        ('search_date', 'datetime64[D]'),
+    ])
+
     def fetch_data_range(self, start_date, end_date):
-        """기간 범위의 환율 데이터 조회"""
+        """기간 범위의 환율 데이터 조회 (통화·날짜별 최신 1건만, 통화 → 날짜 순 정렬)"""
+        # 하루 여러 번 수집된 경우 날짜별 최신 create_at 행만 DB에서 골라 전송량을 줄이고,
+        # 매수 신호 분석(BuySignalAnalyzer)과 같은 일별 시계열로 지표를 그린다.
+        # bkpr은 DOUBLE로 받아 Decimal 객체(object 컬럼) 생성과 원소별 float 변환을 피한다.
         query = """
-        SELECT cur_unit, bkpr, search_date 
-        FROM exchange_rates 
+        SELECT cur_unit, CAST(bkpr AS DOUBLE), search_date
+        FROM exchange_rates e
         WHERE search_date >= %s AND search_date <= %s
         AND cur_unit IN ('USD', 'JPY(100)')
-        ORDER BY search_date, cur_unit
+        AND create_at = (
+            SELECT MAX(e2.create_at) FROM exchange_rates e2
+            WHERE e2.cur_unit = e.cur_unit AND e2.search_date = e.search_date
+        )
+        ORDER BY cur_unit, search_date
         """
 
         try:
             connection = self.db_connector.get_connection()
             with connection.cursor() as cursor:
                 cursor.execute(query, (start_date, end_date))
-                rows = cursor.fetchall()
+                # 비버퍼 커서를 그대로 순회하며 구조화 배열에 적재한다
+                # (fetchall 튜플 리스트를 중간에 만들지 않고, to_datetime 변환 단계도 생략)
+                arr = np.fromiter(cursor, dtype=self._ROW_DTYPE)
 
-                # DataFrame 생성
-                df = pd.DataFrame(rows, columns=['cur_unit', 'bkpr', 'search_date'])
-                # search_date를 datetime 타입으로 변환
-                df['search_date'] = pd.to_datetime(df['search_date'])
-                return df
+            # 컬럼 단위로 DataFrame 생성 (cur_unit은 1바이트 코드의 Categorical로 보관)
+            return pd.DataFrame({
+                'cur_unit': pd.Categorical(arr['cur_unit'], categories=self._CURRENCIES),
+                'bkpr': arr['bkpr'],
+                'search_date': arr['search_date'],
+            })
 
         except Exception as e:
             logger.error(f"데이터 조회 중 오류 발생: {str(e)}")
             raise
 
+    @staticmethod
+    def _rolling_mean_std(arr: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        누적합(prefix sum)으로 rolling 평균과 모표준편차(ddof=0)를 한 번에 계산한다.
+
+        첫 window-1개 구간은 pandas rolling과 동일하게 NaN으로 채운다.
+        큰 값(금 원/g 등)의 제곱합 상쇄 오차를 줄이기 위해 전체 평균으로 중심화한 뒤 계산한다.
+        """
+        n = len(arr)
+        mean = np.full(n, np.nan)
+        std = np.full(n, np.nan)
+        if n < window:
+            return mean, std
+
+        base = arr.mean()
+        centered = arr - base
+        cs = np.concatenate(([0.0], np.cumsum(centered)))
+        cs_sq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+        window_mean = (cs[window:] - cs[:-window]) / window
+        window_var = (cs_sq[window:] - cs_sq[:-window]) / window - window_mean * window_mean
+
+        mean[window - 1:] = window_mean + base
+        std[window - 1:] = np.sqrt(np.maximum(window_var, 0.0))
+        return mean, std
+
     @staticmethod
     def _compute_indicators(currency_df: pd.DataFrame) -> pd.DataFrame:
         """통화 DataFrame에 기술적 지표 컬럼을 추가한다."""
         df = currency_df.copy().sort_values('search_date').reset_index(drop=True)
+        arr = df['bkpr'].to_numpy(dtype=np.float64)
+        df['bkpr'] = arr
         prices = df['bkpr']
 
-        # 이동평균선 (5일, 20일)
-        df['ma5'] = prices.rolling(window=5).mean()
-        df['ma20'] = prices.rolling(window=20).mean()
-
-        # 볼린저 밴드 (20일, 2σ)
-        df['bb_mid'] = df['ma20']
-        rolling_std = prices.rolling(window=20).std(ddof=0)
-        df['bb_upper'] = df['bb_mid'] + 2 * rolling_std
-        df['bb_lower'] = df['bb_mid'] - 2 * rolling_std
+        # 이동평균선 (5일, 20일) + 볼린저 밴드 (20일, 2σ)
+        ma5, _ = ExchangeRateVisualizer._rolling_mean_std(arr, 5)
+        ma20, std20 = ExchangeRateVisualizer._rolling_mean_std(arr, 20)
+        df['ma5'] = ma5
+        df['ma20'] = ma20
+        df['bb_mid'] = ma20
+        df['bb_upper'] = ma20 + 2 * std20
+        df['bb_lower'] = ma20 - 2 * std20
 
         # RSI (14일, Wilder 방식)
         delta = prices.diff()
@@ -117,52 +249,55 @@ class ExchangeRateVisualizer:
         """환율 + MA + 볼린저 밴드 차트를 그린다."""
         ax.set_facecolor(bg_color)
 
-        # 볼린저 밴드 영역
-        valid_bb = df.dropna(subset=['bb_upper', 'bb_lower'])
-        if not valid_bb.empty:
-            ax.fill_between(valid_bb['search_date'],
-                            valid_bb['bb_lower'], valid_bb['bb_upper'],
+        # 라벨 조회 없이 위치 인덱싱으로 쓰기 위해 배열로 한 번만 꺼낸다
+        dates = df['search_date'].to_numpy()
+        prices = df['bkpr'].to_numpy()
+
+        # 볼린저 밴드 영역 (dropna로 DataFrame을 복사하지 않고 마스크로 선택)
+        bb_upper = df['bb_upper'].to_numpy()
+        bb_lower = df['bb_lower'].to_numpy()
+        valid_bb = ~(np.isnan(bb_upper) | np.isnan(bb_lower))
+        if valid_bb.any():
+            ax.fill_between(dates[valid_bb],
+                            bb_lower[valid_bb], bb_upper[valid_bb],
                             alpha=0.10, color='#9CA3AF', label='볼린저 밴드')
 
         # 환율 라인
-        ax.plot(df['search_date'], df['bkpr'],
+        ax.plot(dates, prices,
                 color=main_color, linewidth=2, label=label, zorder=3)
 
         # 이동평균선
-        ax.plot(df['search_date'], df['ma5'],
+        ax.plot(dates, df['ma5'].to_numpy(),
                 color='#EF4444', linewidth=1, alpha=0.8, label='MA5', zorder=2)
-        ax.plot(df['search_date'], df['ma20'],
+        ax.plot(dates, df['ma20'].to_numpy(),
                 color='#8B5CF6', linewidth=1, alpha=0.8, label='MA20', zorder=2)
 
         # 최고/최저 포인트
-        idx_max = df['bkpr'].idxmax()
-        idx_min = df['bkpr'].idxmin()
-        row_max = df.loc[idx_max]
-        row_min = df.loc[idx_min]
+        imax = int(prices.argmax())
+        imin = int(prices.argmin())
 
-        ax.scatter(row_max['search_date'], row_max['bkpr'],
+        ax.scatter(dates[imax], prices[imax],
                    color='#DC2626', s=50, zorder=5, edgecolors='white', linewidth=1.5)
-        ax.scatter(row_min['search_date'], row_min['bkpr'],
+        ax.scatter(dates[imin], prices[imin],
                    color='#16A34A', s=50, zorder=5, edgecolors='white', linewidth=1.5)
-        ax.annotate(f'▲ {row_max["bkpr"]:,.0f}',
-                    xy=(row_max['search_date'], row_max['bkpr']),
+        ax.annotate(f'▲ {prices[imax]:,.0f}',
+                    xy=(dates[imax], prices[imax]),
                     xytext=(0, 10), textcoords='offset points',
                     fontsize=8, fontweight='bold', color='#DC2626', ha='center')
-        ax.annotate(f'▼ {row_min["bkpr"]:,.0f}',
-                    xy=(row_min['search_date'], row_min['bkpr']),
+        ax.annotate(f'▼ {prices[imin]:,.0f}',
+                    xy=(dates[imin], prices[imin]),
                     xytext=(0, -14), textcoords='offset points',
                     fontsize=8, fontweight='bold', color='#16A34A', ha='center')
 
         # 최신값 표시
-        latest = df.iloc[-1]
-        ax.annotate(f'{latest["bkpr"]:,.0f}',
-                    xy=(latest['search_date'], latest['bkpr']),
+        ax.annotate(f'{prices[-1]:,.0f}',
+                    xy=(dates[-1], prices[-1]),
                     xytext=(8, 0), textcoords='offset points',
                     fontsize=9, fontweight='bold', color=main_color, va='center')
 
         # y축 범위
-        y_min = df['bkpr'].min() - y_margin
-        y_max = df['bkpr'].max() + y_margin
+        y_min = prices[imin] - y_margin
+        y_max = prices[imax] + y_margin
         ax.set_ylim(y_min, y_max)
 
         ax.set_ylabel(f'{label} (원)', fontsize=10, fontweight='bold', color=main_color)
@@ -179,28 +314,31 @@ class ExchangeRateVisualizer:
         """RSI 차트를 그린다."""
         ax.set_facecolor(bg_color)
 
-        valid_rsi = df.dropna(subset=['rsi'])
-        if valid_rsi.empty:
+        rsi = df['rsi'].to_numpy()
+        valid = ~np.isnan(rsi)
+        if not valid.any():
             ax.text(0.5, 0.5, 'RSI 데이터 부족', transform=ax.transAxes,
                     ha='center', va='center', fontsize=10, color='#9CA3AF')
             return
 
-        ax.plot(valid_rsi['search_date'], valid_rsi['rsi'],
+        dates = df['search_date'].to_numpy()[valid]
+        rsi = rsi[valid]
+
+        ax.plot(dates, rsi,
                 color=main_color, linewidth=1.5)
 
-        # 과매수/과매도 기준선
-        ax.axhline(y=70, color='#DC2626', linewidth=0.8, linestyle='--', alpha=0.6)
-        ax.axhline(y=30, color='#16A34A', linewidth=0.8, linestyle='--', alpha=0.6)
-        ax.axhline(y=50, color='#9CA3AF', linewidth=0.5, linestyle=':', alpha=0.5)
+        # 과매수/과매도 기준선 (선마다 Line2D를 만들지 않고 LineCollection 하나로 그림)
+        ax.hlines([70, 30, 50], 0, 1, transform=ax.get_yaxis_transform(),
+                  colors=[to_rgba('#DC2626', 0.6), to_rgba('#16A34A', 0.6), to_rgba('#9CA3AF', 0.5)],
+                  linewidths=[0.8, 0.8, 0.5], linestyles=['--', '--', ':'])
 
         # 과매수/과매도 영역 색칠
-        ax.fill_between(valid_rsi['search_date'], 70, 100, alpha=0.05, color='#DC2626')
-        ax.fill_between(valid_rsi['search_date'], 0, 30, alpha=0.05, color='#16A34A')
+        ax.fill_between(dates, 70, 100, alpha=0.05, color='#DC2626')
+        ax.fill_between(dates, 0, 30, alpha=0.05, color='#16A34A')
 
         # 최신 RSI 값 표시
-        latest_rsi = valid_rsi.iloc[-1]['rsi']
-        ax.annotate(f'{latest_rsi:.1f}',
-                    xy=(valid_rsi.iloc[-1]['search_date'], latest_rsi),
+        ax.annotate(f'{rsi[-1]:.1f}',
+                    xy=(dates[-1], rsi[-1]),
                     xytext=(8, 0), textcoords='offset points',
                     fontsize=9, fontweight='bold', color=main_color, va='center')
 
@@ -212,11 +350,21 @@ class ExchangeRateVisualizer:
         for spine in ax.spines.values():
             spine.set_visible(False)
 
-    def create_visualization(self, months=3):
-        """환율 변동 + 기술적 지표 그래프 생성"""
+    def create_visualization(self, months=3, force=False):
+        """
+        환율 변동 + 기술적 지표 그래프 생성
+
+        오늘 그린 같은 기간(months) 그래프가 최근에 저장되어 있으면 DB 조회/렌더링 없이 그 경로를 반환한다.
+        방금 환율을 수집한 경우처럼 다시 그려야 하면 force=True로 호출한다.
+        """
         try:
             # 날짜 범위 계산 (지표 계산용 여유분 포함)
             end_date = datetime.now().date()
+            if not force:
+                cached = find_reusable_graph(self.graph_dir, 'exchange_rate', end_date, months)
+                if cached:
+                    logger.info(f"기존 그래프 재사용: {cached}")
+                    return cached
             start_date = end_date - timedelta(days=months * 31 + 30)
 
             # 데이터 조회
@@ -226,8 +374,12 @@ class ExchangeRateVisualizer:
                 return False
 
             # USD / JPY 분리 및 지표 계산
-            usd = self._compute_indicators(df[df['cur_unit'] == 'USD'])
-            jpy = self._compute_indicators(df[df['cur_unit'] == 'JPY(100)'])
+            # 결과가 통화 순으로 정렬되어 있으므로 불리언 마스크 대신 경계 위치로 잘라낸다
+            # (카테고리 코드도 같은 순서라 문자열 비교 없이 정수 코드에서 찾는다)
+            codes = df['cur_unit'].cat.codes.to_numpy()
+            split = int(np.searchsorted(codes, self._CURRENCIES.index('USD')))
+            jpy = self._compute_indicators(df.iloc[:split])
+            usd = self._compute_indicators(df.iloc[split:])
 
             # 표시 범위 필터링 (지표 계산 후 원래 기간만 표시)
             display_start = end_date - timedelta(days=months * 31)
@@ -244,10 +396,12 @@ class ExchangeRateVisualizer:
             grid_color = '#E5E7EB'
 
             # 4행 레이아웃: USD 환율, USD RSI, JPY 환율, JPY RSI (통화별 그룹)
-            fig, axes = plt.subplots(
-                4, 1, figsize=(12, 12), facecolor='white',
-                sharex=True,
-                gridspec_kw={'height_ratios': [3, 1, 3, 1], 'hspace': 0.12}
+            # pyplot 전역 figure 관리자를 거치지 않고 Figure를 직접 만들어, 오류로 중단돼도
+            # 닫히지 않은 figure가 장기 실행 프로세스(봇/스케줄러)에 쌓이지 않게 한다.
+            fig = Figure(figsize=(12, 12), facecolor='white')
+            axes = fig.subplots(
+                4, 1, sharex=True,
+                gridspec_kw={'height_ratios': [3, 1, 3, 1]}
             )
             ax_usd, ax_rsi_usd, ax_jpy, ax_rsi_jpy = axes
 
@@ -278,14 +432,12 @@ class ExchangeRateVisualizer:
                 fontsize=13, fontweight='bold', color='#1F2937', y=0.99
             )
 
-            plt.tight_layout(rect=[0, 0, 1, 0.97])
+            fig.tight_layout(rect=[0, 0, 1, 0.97], h_pad=1.0)
 
-            # 저장
-            filename = f'exchange_rate_{actual_end.strftime("%Y%m%d")}.png'
-            save_path = self.graph_dir / filename
-            plt.savefig(save_path, dpi=150, bbox_inches='tight',
-                        facecolor='white', edgecolor='none')
-            plt.close()
+            # 저장 (tight_layout으로 여백을 잡았으므로 bbox_inches='tight'의 추가 렌더 패스는 생략)
+            save_path = graph_file_path(self.graph_dir, 'exchange_rate', end_date, months)
+            fig.savefig(save_path, dpi=150,
+                        facecolor='white', edgecolor='none', pil_kwargs=PNG_PIL_KWARGS)
             logger.info(f"그래프가 저장되었습니다: {save_path}")
 
             self.clean_old_graph_files(days=3)
@@ -10,13 +10,17 @@ import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.dates as mdates
+from matplotlib.figure import Figure
 import pandas as pd
 
 from modules.cleanup import FileCleaner
 from modules.mysql_connector import MySQLConnector
-from utils.exchange_rate_visualizer import ExchangeRateVisualizer
+from utils.exchange_rate_visualizer import (
+    PNG_PIL_KWARGS, ExchangeRateVisualizer, find_reusable_graph, graph_file_path,
+)
 from utils.krx_gold_client import GOLD_1KG_ISU_CD
 
 logger = logging.getLogger(__name__)
@@ -35,7 +39,7 @@ class GoldPriceVisualizer:
     def fetch_data_range(self, start_date, end_date) -> pd.DataFrame:
         """기간 범위의 금 종가 조회 (bkpr 컬럼명으로 반환해 헬퍼와 호환)."""
         query = """
-        SELECT clsprc, search_date
+        SELECT CAST(clsprc AS DOUBLE), search_date
         FROM gold_prices
         WHERE isu_cd = %s AND search_date >= %s AND search_date <= %s
         ORDER BY search_date
@@ -49,10 +53,15 @@ class GoldPriceVisualizer:
         df['search_date'] = pd.to_datetime(df['search_date'])
         return df
 
-    def create_visualization(self, months=3):
-        """금시세 변동 + 기술적 지표 그래프 생성"""
+    def create_visualization(self, months=3, force=False):
+        """금시세 변동 + 기술적 지표 그래프 생성 (오늘 그린 같은 기간 그래프가 최근 것이면 재사용, force=True면 다시 그림)"""
         try:
             end_date = datetime.now().date()
+            if not force:
+                cached = find_reusable_graph(self.graph_dir, 'gold_price', end_date, months)
+                if cached:
+                    logger.info(f"기존 금시세 그래프 재사용: {cached}")
+                    return cached
             start_date = end_date - timedelta(days=months * 31 + 30)
 
             df = self.fetch_data_range(start_date, end_date)
@@ -76,9 +85,10 @@ class GoldPriceVisualizer:
             grid_color = '#E5E7EB'
 
             # 2행: 금 가격, 금 RSI
-            fig, (ax_price, ax_rsi) = plt.subplots(
-                2, 1, figsize=(12, 7), facecolor='white', sharex=True,
-                gridspec_kw={'height_ratios': [3, 1], 'hspace': 0.12}
+            fig = Figure(figsize=(12, 7), facecolor='white')
+            ax_price, ax_rsi = fig.subplots(
+                2, 1, sharex=True,
+                gridspec_kw={'height_ratios': [3, 1]}
             )
 
             # 가격 스케일이 20만원대라 y_margin을 넉넉히
@@ -97,13 +107,11 @@ class GoldPriceVisualizer:
                 f'({actual_start.strftime("%Y.%m.%d")} ~ {actual_end.strftime("%Y.%m.%d")})',
                 fontsize=13, fontweight='bold', color='#1F2937', y=0.99
             )
-            plt.tight_layout(rect=[0, 0, 1, 0.97])
+            fig.tight_layout(rect=[0, 0, 1, 0.97], h_pad=1.0)
 
-            filename = f'gold_price_{actual_end.strftime("%Y%m%d")}.png'
-            save_path = self.graph_dir / filename
-            plt.savefig(save_path, dpi=150, bbox_inches='tight',
-                        facecolor='white', edgecolor='none')
-            plt.close()
+            save_path = graph_file_path(self.graph_dir, 'gold_price', end_date, months)
+            fig.savefig(save_path, dpi=150,
+                        facecolor='white', edgecolor='none', pil_kwargs=PNG_PIL_KWARGS)
             logger.info(f"금시세 그래프가 저장되었습니다: {save_path}")
 
             FileCleaner(target_dir=self.graph_dir, days=3).remove_old_files()
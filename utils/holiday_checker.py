@@ -1,18 +1,62 @@
 # utils/holiday_checker.py
 
+import json
+import os
+import threading
+import time
 import requests
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from pathlib import Path
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from configs.apis_setting import HOLIDAY_API_CONFIG
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 공휴일 API 호출 타임아웃 (연결, 읽기) - 응답이 없을 때 스케줄러가 멈추지 않도록 제한
+REQUEST_TIMEOUT = (3, 10)
+
+# 공휴일 API 호출용 세션 (프로세스 전체에서 공유해 TCP 연결을 재사용)
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """재시도 전략이 설정된 공유 세션을 반환한다 (최초 호출 시 생성)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+
+            # 일시적인 5xx 응답은 짧은 백오프로 재시도
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504]
+            )
+
+            adapter = HTTPAdapter(max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
 
 class HolidayChecker:
     """공휴일 조회 클래스"""
 
+    # (연, 월) -> (조회 시각, {YYYYMMDD: 공휴일 이름}). 스케줄러가 실행마다 새 인스턴스를 만들므로
+    # 클래스 단위로 공유한다. 지난 달은 프로세스 수명 동안 재사용하고,
+    # 이번 달 이후는 CURRENT_MONTH_TTL_SECONDS가 지나면 다시 조회한다.
+    _month_cache: dict[tuple[int, int], tuple[float, dict[str, str]]] = {}
+
+    # 지난 달의 공휴일은 바뀌지 않으므로 캐시를 만료 없이 쓰고,
+    # 이번 달 이후는 임시공휴일 지정에 대비해 하루가 지나면 다시 조회한다.
+    CURRENT_MONTH_TTL_SECONDS = 24 * 60 * 60
+
     def __init__(self):
         """
         HolidayChecker 초기화
@@ -20,6 +64,7 @@ class HolidayChecker:
         """
         self.api_key = HOLIDAY_API_CONFIG['api_key']
         self.base_url = HOLIDAY_API_CONFIG['base_url']
+        self.cache_dir = Path(HOLIDAY_API_CONFIG['cache_dir'])
 
         if not self.api_key:
             raise ValueError("HOLIDAY_API_KEY가 환경변수에 설정되지 않았습니다.")
@@ -40,6 +85,94 @@ class HolidayChecker:
             if result_code is None or result_msg is None:
                 raise ValueError("API 응답에 필수 헤더 정보가 없습니다.")
 
+    @staticmethod
+    def _is_past_month(year, month):
+        """이미 지난 달이면 True (공휴일 목록이 더 바뀌지 않음)"""
+        now = datetime.now()
+        return (year, month) < (now.year, now.month)
+
+    def _is_fresh(self, year, month, fetched_at):
+        """fetched_at(epoch 초)에 조회한 캐시를 아직 쓸 수 있는지 여부"""
+        return (self._is_past_month(year, month)
+                or time.time() - fetched_at <= self.CURRENT_MONTH_TTL_SECONDS)
+
+    def _cache_path(self, year, month):
+        return self.cache_dir / f"{year:04d}-{month:02d}.json"
+
+    def _load_disk_cache(self, year, month):
+        """
+        디스크 캐시가 유효하면 (파일 저장 시각, 공휴일 dict) 반환, 없거나 만료/손상되면 None
+        저장 시각을 함께 돌려줘 메모리 캐시도 파일 기준으로 만료되게 한다.
+        """
+        path = self._cache_path(year, month)
+        try:
+            saved_at = path.stat().st_mtime
+            if not self._is_fresh(year, month, saved_at):
+                return None
+            return saved_at, json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"공휴일 캐시 읽기 실패 ({path}): {str(e)}")
+            return None
+
+    def _save_disk_cache(self, year, month, holidays):
+        """공휴일 dict를 디스크에 저장 (임시 파일 후 교체로 원자적 기록)"""
+        path = self._cache_path(year, month)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(holidays, ensure_ascii=False), encoding='utf-8')
+            tmp.replace(path)
+        except OSError as e:
+            # 캐시 저장 실패는 조회 결과에 영향을 주지 않는다
+            logger.warning(f"공휴일 캐시 저장 실패 ({path}): {str(e)}")
+            tmp.unlink(missing_ok=True)
+
+    def _fetch_month(self, year, month):
+        """
+        해당 월의 공휴일 목록 조회 (메모리 → 디스크 → API 순으로 조회)
+
+        Returns:
+            dict: {YYYYMMDD: 공휴일 이름} (isHoliday == 'Y'인 항목만)
+        """
+        key = (year, month)
+        entry = self._month_cache.get(key)
+        if entry is not None and self._is_fresh(year, month, entry[0]):
+            return entry[1]
+
+        entry = self._load_disk_cache(year, month)
+        if entry is not None:
+            self._month_cache[key] = entry
+            return entry[1]
+
+        params = {
+            'serviceKey': self.api_key,
+            'solYear': f'{year:04d}',
+            'solMonth': f'{month:02d}'
+        }
+
+        logger.debug(f"공휴일 API 호출: {year}년 {month:02d}월 조회")
+        response = _get_session().get(self.base_url, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+        # XML 파싱
+        root = ET.fromstring(response.content)
+
+        # 응답 상태 확인
+        self._check_response_status(root)
+
+        # 필요한 필드만 findtext로 읽는다 (중간 Element 조회/None 검사 생략)
+        holidays = {}
+        for item in root.iterfind('.//items/item'):
+            locdate = item.findtext('locdate')
+            if locdate and item.findtext('isHoliday') == 'Y':
+                holidays[locdate] = item.findtext('dateName') or "공휴일"
+
+        self._month_cache[key] = (time.time(), holidays)
+        self._save_disk_cache(year, month, holidays)
+        return holidays
+
     def check_holiday(self, date=None):
         """
         특정 날짜가 공휴일인지 확인
@@ -64,40 +197,15 @@ class HolidayChecker:
                 date = datetime.now()
 
             target_date = date.strftime('%Y%m%d')
-            params = {
-                'serviceKey': self.api_key,
-                'solYear': date.strftime('%Y'),
-                'solMonth': date.strftime('%m')
-            }
-
-            logger.debug(f"공휴일 API 호출: {date.strftime('%Y년 %m월')} 조회")
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
-
-            # XML 파싱
-            root = ET.fromstring(response.content)
-
-            # 응답 상태 확인
-            self._check_response_status(root)
-
-            # 공휴일 데이터 확인
-            items = root.find('.//items')
-            if items is not None:
-                for item in items.findall('item'):
-                    locdate = item.find('locdate')
-                    is_holiday = item.find('isHoliday')
-
-                    if (locdate is not None and locdate.text == target_date and
-                            is_holiday is not None and is_holiday.text == 'Y'):
-                        date_name = item.find('dateName')
-                        holiday_name = date_name.text if date_name is not None else "공휴일"
-
-                        logger.info(f"공휴일 확인: {target_date}은 {holiday_name}입니다.")
-                        return {
-                            'is_holiday': True,
-                            'holiday_name': holiday_name,
-                            'date': target_date
-                        }
+            holiday_name = self._fetch_month(date.year, date.month).get(target_date)
+
+            if holiday_name is not None:
+                logger.info(f"공휴일 확인: {target_date}은 {holiday_name}입니다.")
+                return {
+                    'is_holiday': True,
+                    'holiday_name': holiday_name,
+                    'date': target_date
+                }
 
             logger.info(f"공휴일 아님: {target_date}")
             return {
@@ -1,7 +1,5 @@
 """텔레그램 HTML 포맷 환율 메시지 생성 모듈"""
 
-from typing import Optional
-
 
 class HTMLMessageFormatter:
     """텔레그램 HTML 포맷 환율 메시지 생성"""
@@ -20,6 +18,9 @@ class HTMLMessageFormatter:
         'EUR': '유로',
     }
 
+    # 증감 표시 템플릿 (하락, 변동없음, 상승 순) - 부호(-1/0/1) + 1로 인덱싱
+    CHANGE_TEMPLATES = ('🔴 ↓{:,.2f}', '─ 변동없음', '🟢 ↑{:,.2f}')
+
     def format_message(
         self,
         date: str,
@@ -47,57 +48,35 @@ class HTMLMessageFormatter:
         ordered_currencies = [c for c in display_order if c in rates]
         ordered_currencies += [c for c in rates if c not in display_order]
 
-        # 각 통화별 블록 생성
+        # 각 통화별 블록을 하나의 라인 리스트에 바로 쌓고 마지막에 한 번만 join
         for currency in ordered_currencies:
             today_rate = rates[currency]
-            yesterday_rate = yesterday_rates.get(currency)
-            sparkline = sparklines.get(currency, '')
-            block = self._format_currency_block(
-                currency, today_rate, yesterday_rate, sparkline
-            )
-            lines.append('')  # 빈 줄로 블록 구분
-            lines.append(block)
-
-        return '\n'.join(lines)
+            emoji = self.CURRENCY_EMOJI.get(currency, '💱')
+            name = self.CURRENCY_NAME.get(currency, currency)
 
-    def _format_currency_block(
-        self,
-        currency: str,
-        today_rate: float,
-        yesterday_rate: Optional[float],
-        sparkline: str,
-    ) -> str:
-        """개별 통화 블록 포맷"""
-        emoji = self.CURRENCY_EMOJI.get(currency, '💱')
-        name = self.CURRENCY_NAME.get(currency, currency)
-
-        # 통화 제목 라인
-        header = f'{emoji} <b>{name}({currency})</b>'
+            lines.append('')  # 빈 줄로 블록 구분
+            lines.append(f'{emoji} <b>{name}({currency})</b>')
 
-        # 환율 값 + 증감 표시 라인
-        rate_str = f'<code>{self._format_rate_value(today_rate)}</code>'
-        if yesterday_rate is not None:
-            change_str = self._format_change(today_rate, yesterday_rate)
-            rate_line = f'{rate_str} {change_str}'
-        else:
-            rate_line = rate_str
+            # 환율 값 + 증감 표시 라인
+            rate_str = f'<code>{self._format_rate_value(today_rate)}</code>'
+            yesterday_rate = yesterday_rates.get(currency)
+            if yesterday_rate is not None:
+                lines.append(f'{rate_str} {self._format_change(today_rate, yesterday_rate)}')
+            else:
+                lines.append(rate_str)
 
-        # 스파크라인 라인
-        parts = [header, rate_line]
-        if sparkline:
-            parts.append(f'<code>{sparkline}</code>')
+            # 스파크라인 라인
+            sparkline = sparklines.get(currency)
+            if sparkline:
+                lines.append(f'<code>{sparkline}</code>')
 
-        return '\n'.join(parts)
+        return '\n'.join(lines)
 
     def _format_change(self, today: float, yesterday: float) -> str:
         """증감 표시 포맷 (이모지 + 화살표 + 금액)"""
         diff = today - yesterday
-        if diff > 0:
-            return f'🟢 ↑{abs(diff):,.2f}'
-        elif diff < 0:
-            return f'🔴 ↓{abs(diff):,.2f}'
-        else:
-            return '─ 변동없음'
+        # '변동없음' 템플릿에는 자리표시자가 없어 format 인자가 무시된다
+        return self.CHANGE_TEMPLATES[(diff > 0) - (diff < 0) + 1].format(abs(diff))
 
     def _format_rate_value(self, rate: float) -> str:
         """환율 값 포맷 (천 단위 구분자, 소수점 2자리)"""
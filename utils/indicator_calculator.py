@@ -4,9 +4,17 @@
 환율 데이터에 대한 이동평균, RSI, 볼린저 밴드 등
 기술적 지표를 계산하는 순수 함수 모음.
 모든 메서드는 상태를 갖지 않는 정적 메서드(static method)이다.
+가격은 리스트 또는 NumPy 배열로 받으며, 윈도우 단위 연산은 NumPy로 수행한다.
 """
 
-import math
+import numpy as np
+
+
+def _as_array(prices) -> np.ndarray:
+    """가격 시퀀스를 float64 배열로 변환 (이미 float64 배열이면 그대로 반환)"""
+    if type(prices) is np.ndarray and prices.dtype == np.float64:
+        return prices
+    return np.asarray(prices, dtype=np.float64)
 
 
 class IndicatorCalculator:
@@ -30,7 +38,7 @@ class IndicatorCalculator:
         if len(prices) < period or period <= 0:
             return None
 
-        return sum(prices[-period:]) / period
+        return float(_as_array(prices)[-period:].sum()) / period
 
     @staticmethod
     def rsi(prices: list[float], period: int = 14) -> float | None:
@@ -51,22 +59,23 @@ class IndicatorCalculator:
         if len(prices) < period + 1 or period <= 0:
             return None
 
-        # 가격 변화량 계산
-        changes = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+        changes = np.diff(_as_array(prices))
 
         # 첫 번째 평균 상승/하락폭 계산 (초기 period개의 변화량)
-        initial_gains = [max(c, 0) for c in changes[:period]]
-        initial_losses = [abs(min(c, 0)) for c in changes[:period]]
-
-        avg_gain = sum(initial_gains) / period
-        avg_loss = sum(initial_losses) / period
+        initial_changes = changes[:period]
+        avg_gain = float(initial_changes[initial_changes > 0].sum()) / period
+        avg_loss = float(-initial_changes[initial_changes < 0].sum()) / period
 
         # Wilder 평활법으로 나머지 변화량 반영
-        for change in changes[period:]:
-            gain = max(change, 0)
-            loss = abs(min(change, 0))
-            avg_gain = (avg_gain * (period - 1) + gain) / period
-            avg_loss = (avg_loss * (period - 1) + loss) / period
+        # avg_k = d * avg_(k-1) + x_k / period (d = (period-1)/period) 재귀식을 전개한
+        # 닫힌 형태 d^K * avg_0 + Σ d^(K-k) * x_k / period 로 계산해 파이썬 루프를 없앤다.
+        tail = changes[period:]
+        if tail.size:
+            decay = (period - 1) / period
+            weights = decay ** np.arange(tail.size - 1, -1, -1)
+            scale = decay ** tail.size
+            avg_gain = scale * avg_gain + float(weights @ np.maximum(tail, 0.0)) / period
+            avg_loss = scale * avg_loss + float(weights @ np.maximum(-tail, 0.0)) / period
 
         # RSI 계산
         if avg_loss == 0:
@@ -99,14 +108,11 @@ class IndicatorCalculator:
             return None
 
         # 마지막 period개의 가격으로 계산
-        recent_prices = prices[-period:]
+        recent_prices = _as_array(prices)[-period:]
 
-        # 중단 = 단순 이동평균
-        middle = sum(recent_prices) / period
-
-        # 모표준편차 계산
-        variance = sum((p - middle) ** 2 for p in recent_prices) / period
-        std_dev = math.sqrt(variance)
+        # 중단 = 단순 이동평균, 모표준편차(ddof=0)
+        middle = float(recent_prices.mean())
+        std_dev = float(recent_prices.std())
 
         # 상단/하단 밴드
         upper = middle + num_std * std_dev
@@ -134,7 +140,7 @@ class IndicatorCalculator:
         if len(prices) < min_days:
             return None
 
-        lowest = min(prices)
+        lowest = float(_as_array(prices).min())
         num_days = len(prices)
 
         return (lowest, num_days)
@@ -175,9 +181,9 @@ class IndicatorCalculator:
         Returns:
             0~100 사이의 백분위 또는 데이터 없음 시 None
         """
-        if not prices:
+        if len(prices) == 0:
             return None
-        below = sum(1 for p in prices if p < today_rate)
+        below = int(np.count_nonzero(_as_array(prices) < today_rate))
         return below / len(prices) * 100.0
 
     @staticmethod
@@ -205,14 +211,20 @@ class IndicatorCalculator:
         if short_period >= long_period:
             return None
 
+        # 배열 입력이면 필요한 윈도우만 파이썬 float 리스트로 꺼낸다.
+        # 원소마다 NumPy 스칼라를 만들며 sum()하는 것보다 빠르고, 리스트 입력과 결과가 같다.
+        if isinstance(prices, np.ndarray):
+            prices = prices[-long_period - 1:].tolist()
+
         # 당일 MA 계산 (전체 리스트 기준)
         today_short_ma = sum(prices[-short_period:]) / short_period
         today_long_ma = sum(prices[-long_period:]) / long_period
 
-        # 전일 MA 계산 (마지막 원소 제외)
-        prev_prices = prices[:-1]
-        prev_short_ma = sum(prev_prices[-short_period:]) / short_period
-        prev_long_ma = sum(prev_prices[-long_period:]) / long_period
+        # 전일 MA 계산 (마지막 원소 제외) - 전체 리스트를 복사하지 않고 윈도우만 잘라낸다.
+        # 당일 합계에서 값을 빼고 더하는 증분 갱신은 반올림 오차 때문에 단기/장기 MA가
+        # 거의 같은 경계에서 판정이 뒤집힐 수 있어, 윈도우 합을 직접 계산한다.
+        prev_short_ma = sum(prices[-short_period - 1:-1]) / short_period
+        prev_long_ma = sum(prices[-long_period - 1:-1]) / long_period
 
         # 골든크로스: 전일 단기 < 장기, 당일 단기 >= 장기
         if prev_short_ma < prev_long_ma and today_short_ma >= today_long_ma:
@@ -4,6 +4,8 @@
 Signal 리스트를 통화별로 그룹핑하여 텔레그램 HTML 메시지로 변환한다.
 """
 
+from collections import defaultdict
+
 from utils.buy_signal_analyzer import Signal
 
 
@@ -49,57 +51,34 @@ class SignalMessageFormatter:
 
         lines = ["🚨 <b>환율 매수 신호 감지</b>"]
 
-        # 통화별로 그룹핑 (입력 순서 유지를 위해 dict 사용)
-        grouped: dict[str, list[Signal]] = {}
+        # 통화별로 그룹핑 (dict는 삽입 순서를 유지하므로 입력 순서대로 출력됨)
+        grouped: defaultdict[str, list[Signal]] = defaultdict(list)
         for signal in signals:
-            grouped.setdefault(signal.currency, []).append(signal)
+            grouped[signal.currency].append(signal)
 
-        # 통화별 블록 생성
+        # 통화별 블록을 하나의 라인 리스트에 바로 쌓고 마지막에 한 번만 join
+        signal_emoji = self.SIGNAL_EMOJI.get
         for currency, currency_signals in grouped.items():
             lines.append("")  # 빈 줄로 블록 구분
-            lines.append(self._format_currency_block(currency, currency_signals))
+            lines.append(self._format_currency_header(currency, currency_signals[0].current_rate))
+            lines.extend(
+                f"{signal_emoji(signal.signal_type, '📌')} {signal.message}"
+                for signal in currency_signals
+            )
 
         return "\n".join(lines)
 
-    def _format_currency_block(
-        self, currency: str, signals: list[Signal]
-    ) -> str:
+    def _format_currency_header(self, currency: str, current_rate: float) -> str:
         """
-        단일 통화의 신호 블록을 포맷한다.
+        통화 헤더 라인을 포맷한다.
 
         Args:
             currency: 통화 코드 (예: "USD", "JPY(100)")
-            signals: 해당 통화의 Signal 리스트
+            current_rate: 해당 통화의 현재 매매기준율
 
         Returns:
-            통화 헤더 + 신호 라인들로 구성된 문자열
+            예: 💵 <b>달러(USD)</b> - 현재: 1,425.00원
         """
         emoji = self.CURRENCY_EMOJI.get(currency, "💱")
         name = self.CURRENCY_NAME.get(currency, currency)
-        current_rate = signals[0].current_rate
-
-        # 통화 헤더 라인: 💵 <b>달러(USD)</b> - 현재: 1,425.00원
-        header = (
-            f"{emoji} <b>{name}({currency})</b>"
-            f" - 현재: {current_rate:,.2f}원"
-        )
-
-        # 각 신호 라인 생성
-        signal_lines = [
-            self._format_signal_line(signal) for signal in signals
-        ]
-
-        return "\n".join([header] + signal_lines)
-
-    def _format_signal_line(self, signal: Signal) -> str:
-        """
-        개별 신호를 이모지 + 메시지 형태로 포맷한다.
-
-        Args:
-            signal: Signal 객체
-
-        Returns:
-            이모지와 메시지가 포함된 한 줄 문자열
-        """
-        emoji = self.SIGNAL_EMOJI.get(signal.signal_type, "📌")
-        return f"{emoji} {signal.message}"
+        return f"{emoji} <b>{name}({currency})</b> - 현재: {current_rate:,.2f}원"
@@ -1,5 +1,12 @@
+import numpy as np
+
 # 유니코드 블록 문자 (8단계)
 SPARK_BLOCKS = '▁▂▃▄▅▆▇█'
+_SPARK_BLOCK_CHARS = tuple(SPARK_BLOCKS)  # 인덱싱 시 문자열 객체를 새로 만들지 않음
+_SPARK_BLOCKS_ARR = np.array(_SPARK_BLOCK_CHARS)
+
+# 이 길이 이상이면 NumPy 벡터 연산으로 변환 (짧은 입력은 배열 생성 비용이 더 큼)
+VECTORIZE_MIN_LEN = 64
 
 
 class SparklineGenerator:
@@ -14,9 +21,12 @@ class SparklineGenerator:
         - 모든 값 동일: 중간 블록(▄) 반환
         - 최솟값 → ▁, 최댓값 → █ 매핑
         """
-        if not values:
+        if len(values) == 0:
             return ""
 
+        if len(values) >= VECTORIZE_MIN_LEN:
+            return SparklineGenerator._generate_vectorized(values)
+
         min_val = min(values)
         max_val = max(values)
 
@@ -24,10 +34,24 @@ class SparklineGenerator:
             return '▄' * len(values)
 
         # 각 값을 0~7 인덱스로 매핑
+        # 역수 곱셈으로 바꾸면 반올림이 달라져 최댓값이 █ 아래로 떨어질 수 있으므로
+        # 나눗셈 순서는 유지하고 분모만 루프 밖에서 한 번 계산한다
         scale = len(SPARK_BLOCKS) - 1
-        result = []
-        for v in values:
-            idx = int((v - min_val) / (max_val - min_val) * scale)
-            result.append(SPARK_BLOCKS[idx])
+        span = max_val - min_val
+        blocks = _SPARK_BLOCK_CHARS
+        return ''.join([blocks[int((v - min_val) / span * scale)] for v in values])
+
+    @staticmethod
+    def _generate_vectorized(values) -> str:
+        """generate와 같은 매핑을 NumPy로 계산 (연산 순서를 맞춰 결과 동일)"""
+        arr = np.asarray(values, dtype=np.float64)
+        min_val = arr.min()
+        max_val = arr.max()
+
+        if min_val == max_val:
+            return '▄' * arr.size
 
-        return ''.join(result)
+        scale = len(SPARK_BLOCKS) - 1
+        idx = ((arr - min_val) / (max_val - min_val) * scale).astype(np.intp)
+        # 문자(U1) 배열을 길이 n짜리 문자열 하나로 재해석해 문자 단위 join을 피한다
+        return str(_SPARK_BLOCKS_ARR[idx].view(f'U{arr.size}')[0])